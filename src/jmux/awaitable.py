@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import math
+from collections import deque
 from enum import Enum
 from types import NoneType
 from typing import (
     AsyncGenerator,
+    Deque,
     Generic,
     Protocol,
     Set,
@@ -14,8 +15,7 @@ from typing import (
     runtime_checkable,
 )
 
-from anyio import Event, create_memory_object_stream
-from anyio.streams.memory import MemoryObjectReceiveStream, MemoryObjectSendStream
+from anyio import Event
 
 from jmux.error import NothingEmittedError, SinkClosedError
 from jmux.helpers import extract_types_from_generic_alias
@@ -34,6 +34,11 @@ class UnderlyingGenericMixin(Generic[T]):
     class at runtime.
     """
 
+    __slots__ = ()
+
+    # Nested JMux type resolved by the owning JMux, if the sink holds one.
+    _underlying_type: Type | None = None
+
     def get_underlying_generics(self) -> Set[Type[T]]:
         """
         Returns the underlying generic types of the class.
@@ -108,17 +113,24 @@ class IAsyncSink(Protocol[T]):
 class StreamableValues(UnderlyingGenericMixin[T], Generic[T]):
     """
     A class that represents a stream of values that can be asynchronously iterated over.
-    It uses anyio memory object streams to store the items and allows for putting items
-    into the stream and closing it when no more items will be added.
+    Items are buffered in a deque and consumers are woken through an anyio event,
+    which allows for putting items into the stream without suspending the producer and
+    closing it when no more items will be added.
     """
 
-    _send_stream: MemoryObjectSendStream[T | None]
-    _receive_stream: MemoryObjectReceiveStream[T | None]
+    __slots__ = (
+        "_items",
+        "_item_available",
+        "_last_item",
+        "_closed",
+        "_underlying_type",
+        "__orig_class__",
+    )
 
     def __init__(self):
-        self._send_stream, self._receive_stream = create_memory_object_stream[T | None](
-            max_buffer_size=math.inf
-        )
+        self._underlying_type = None
+        self._items: Deque[T] = deque()
+        self._item_available: Event | None = None
         self._last_item: T | None = None
         self._closed = False
 
@@ -147,10 +159,14 @@ class StreamableValues(UnderlyingGenericMixin[T], Generic[T]):
         Raises:
             ValueError: If the stream is closed.
         """
+        self._put_sync(item)
+
+    def _put_sync(self, item: T) -> None:
         if self._closed:
             raise ValueError("Cannot put item into a closed sink.")
         self._last_item = item
-        await self._send_stream.send(item)
+        self._items.append(item)
+        self._notify_consumers()
 
     async def close(self):
         """
@@ -159,23 +175,28 @@ class StreamableValues(UnderlyingGenericMixin[T], Generic[T]):
         Raises:
             SinkClosedError: If the stream is already closed.
         """
+        self._close_sync()
+
+    def _close_sync(self) -> None:
         if self._closed:
             raise SinkClosedError(
                 f"SinkType {self.get_sink_type()}[{self.get_underlying_main_generic()}]"
                 + " is already closed."
             )
         self._closed = True
-        await self._send_stream.send(None)
-        await self._send_stream.aclose()
+        self._notify_consumers()
 
     async def ensure_closed(self):
         """
         Ensures that the stream is closed.
         If the stream is already closed, this method does nothing.
         """
+        self._ensure_closed_sync()
+
+    def _ensure_closed_sync(self) -> None:
         if self._closed:
             return
-        await self.close()
+        self._close_sync()
 
     def get_current(self) -> T:
         """
@@ -203,17 +224,22 @@ class StreamableValues(UnderlyingGenericMixin[T], Generic[T]):
     def __aiter__(self):
         return self._stream()
 
+    def _notify_consumers(self) -> None:
+        if self._item_available is not None:
+            self._item_available.set()
+            self._item_available = None
+
     async def _stream(self) -> AsyncGenerator[T, None]:
-        try:
-            while True:
-                item = await self._receive_stream.receive()
-                if item is None and self._closed:
-                    break
-                if item is None:
-                    raise ValueError("Received None item, but the sink is not closed.")
-                yield item
-        finally:
-            await self._receive_stream.aclose()
+        items = self._items
+        while True:
+            while items:
+                yield items.popleft()
+            if self._closed:
+                return
+            # anyio events cannot be cleared, so a fresh one is armed per wait.
+            if self._item_available is None:
+                self._item_available = Event()
+            await self._item_available.wait()
 
 
 class AwaitableValue(UnderlyingGenericMixin[T], Generic[T]):
@@ -222,7 +248,16 @@ class AwaitableValue(UnderlyingGenericMixin[T], Generic[T]):
     It can be awaited to get the value, and it can only be set once.
     """
 
+    __slots__ = (
+        "_is_closed",
+        "_event",
+        "_value",
+        "_underlying_type",
+        "__orig_class__",
+    )
+
     def __init__(self):
+        self._underlying_type = None
         self._is_closed = False
         self._event = Event()
         self._value: T | None = None
@@ -237,6 +272,9 @@ class AwaitableValue(UnderlyingGenericMixin[T], Generic[T]):
         Raises:
             ValueError: If the value has already been set.
         """
+        self._put_sync(value)
+
+    def _put_sync(self, value: T) -> None:
         if self._value is not None or self._is_closed or self._event.is_set():
             raise ValueError("AwaitableValue can only be set once.")
         self._value = value
@@ -251,6 +289,9 @@ class AwaitableValue(UnderlyingGenericMixin[T], Generic[T]):
             NothingEmittedError: If the AwaitableValue is closed without a value,
                 and the underlying type is not NoneType.
         """
+        self._close_sync()
+
+    def _close_sync(self) -> None:
         if self._is_closed:
             raise SinkClosedError(
                 f"SinkType {self.get_sink_type()}"
@@ -269,9 +310,12 @@ class AwaitableValue(UnderlyingGenericMixin[T], Generic[T]):
         Ensures that the AwaitableValue is closed.
         If the AwaitableValue is already closed, this method does nothing.
         """
+        self._ensure_closed_sync()
+
+    def _ensure_closed_sync(self) -> None:
         if self._is_closed:
             return
-        await self.close()
+        self._close_sync()
 
     def get_current(self) -> T:
         """
@@ -1,17 +1,31 @@
-from typing import Protocol
+from typing import List, Protocol, Tuple
 
 
 class IDecoder(Protocol):
     def push(self, ch: str) -> str | None: ...
 
+    def push_chunk(self, chunk: str, start: int = 0) -> Tuple[int, str]: ...
+
     def is_terminating_quote(self, ch: str) -> bool: ...
 
+    def flush(self) -> str: ...
+
     def reset(self) -> None: ...
 
     @property
     def buffer(self) -> str: ...
 
 
+# Escape states of StringEscapeDecoder: outside an escape, after a backslash,
+# and collecting the hex digits of a unicode escape.
+_ESCAPE_NONE = 0
+_ESCAPE_PENDING = 1
+_ESCAPE_UNICODE = 2
+
+_DECODER_POOL: List["StringEscapeDecoder"] = []
+_DECODER_POOL_SIZE = 64
+
+
 class StringEscapeDecoder:
     r"""
     Decoder for strings with escape sequences, such as JSON strings.
@@ -28,55 +42,238 @@ class StringEscapeDecoder:
         "r": "\r",
         "t": "\t",
     }
+    # `escape_map` as a table indexed by code point; other ASCII characters
+    # map to themselves.
+    _escape_lut = tuple(map(escape_map.get, map(chr, range(128)), map(chr, range(128))))
 
     def __init__(self):
-        self._buffer = ""
-        self._string_escape = False
-        self._is_parsing_unicode = False
+        # Decoded text is `_head` followed by the not yet joined `_parts`. A
+        # value that arrives as one fragment stays in `_head` and is never
+        # joined.
+        self._head = ""
+        self._parts: List[str] = []
+        self._escape_state = _ESCAPE_NONE
         self._unicode_buffer = ""
+        self._high_surrogate = ""
+
+    @classmethod
+    def acquire(cls) -> "StringEscapeDecoder":
+        """
+        Returns a reset decoder, reusing a released one if available.
+
+        Returns:
+            A decoder with an empty buffer.
+        """
+        if cls is StringEscapeDecoder and _DECODER_POOL:
+            return _DECODER_POOL.pop()
+        return cls()
+
+    @staticmethod
+    def release(decoder: "StringEscapeDecoder") -> None:
+        """
+        Resets a decoder and returns it to the pool for reuse. The caller must
+        not use the decoder afterwards.
+
+        Args:
+            decoder: The decoder to release.
+        """
+        if len(_DECODER_POOL) < _DECODER_POOL_SIZE:
+            decoder.reset()
+            _DECODER_POOL.append(decoder)
 
     def push(self, ch: str) -> str | None:
-        if self._is_parsing_unicode:
-            self._unicode_buffer += ch
-            if len(self._unicode_buffer) == 4:
-                code_point = int(self._unicode_buffer, 16)
-                decoded_char = chr(code_point)
-                self._buffer += decoded_char
-                self._is_parsing_unicode = False
-                self._unicode_buffer = ""
-                return decoded_char
-            return None
+        escape_state = self._escape_state
+        if escape_state == _ESCAPE_NONE:
+            if ch == "\\":
+                self._escape_state = _ESCAPE_PENDING
+                return None
+            if self._high_surrogate:
+                ch = self._pair_surrogates(ch, hold=False)
+            self._parts.append(ch)
+            return ch
 
-        if self._string_escape:
-            self._string_escape = False
+        if escape_state == _ESCAPE_PENDING:
             if ch == "u":
-                self._is_parsing_unicode = True
+                self._escape_state = _ESCAPE_UNICODE
                 self._unicode_buffer = ""
                 return None
-            escaped_char = self.escape_map.get(ch, ch)
-            self._buffer += escaped_char
+            self._escape_state = _ESCAPE_NONE
+            code = ord(ch)
+            escaped_char = self._escape_lut[code] if code < 128 else ch
+            if self._high_surrogate:
+                escaped_char = self._pair_surrogates(escaped_char, hold=False)
+            self._parts.append(escaped_char)
             return escaped_char
 
-        if ch == "\\":
-            self._string_escape = True
+        self._unicode_buffer += ch
+        if len(self._unicode_buffer) < 4:
             return None
-        else:
-            self._buffer += ch
-            return ch
+        decoded = self._pair_surrogates(chr(int(self._unicode_buffer, 16)), hold=True)
+        self._escape_state = _ESCAPE_NONE
+        self._unicode_buffer = ""
+        if not decoded:
+            return None
+        self._parts.append(decoded)
+        return decoded
+
+    def push_chunk(self, chunk: str, start: int = 0) -> Tuple[int, str]:
+        """
+        Decodes `chunk` from `start` up to the first unescaped quote.
+
+        Args:
+            chunk: The raw string content to decode.
+            start: The index in `chunk` to start decoding at.
+
+        Returns:
+            The index of the terminating quote, or `len(chunk)` if the string
+            continues in the next chunk, and the text decoded from this chunk.
+        """
+        length = len(chunk)
+        if self._escape_state == _ESCAPE_NONE and not self._high_surrogate:
+            # Escape-free text up to the quote or the end of the chunk is
+            # taken as one slice.
+            quote = chunk.find('"', start)
+            if quote == -1:
+                quote = length
+            if chunk.find("\\", start, quote) == -1:
+                text = chunk[start:quote]
+                if text:
+                    if self._head or self._parts:
+                        self._parts.append(text)
+                    else:
+                        self._head = text
+                return quote, text
+
+        decoded = []
+        surrogate = False
+        index = start
+        # Finish an escape sequence left open at the end of the previous chunk.
+        if self._escape_state == _ESCAPE_PENDING and index < length:
+            ch = chunk[index]
+            index += 1
+            if ch == "u":
+                self._escape_state = _ESCAPE_UNICODE
+                self._unicode_buffer = ""
+            else:
+                self._escape_state = _ESCAPE_NONE
+                code = ord(ch)
+                decoded.append(self._escape_lut[code] if code < 128 else ch)
+        if self._escape_state == _ESCAPE_UNICODE and index < length:
+            missing = 4 - len(self._unicode_buffer)
+            self._unicode_buffer += chunk[index : index + missing]
+            index = min(index + missing, length)
+            if len(self._unicode_buffer) == 4:
+                code_point = int(self._unicode_buffer, 16)
+                surrogate = 0xD800 <= code_point <= 0xDFFF
+                decoded.append(chr(code_point))
+                self._escape_state = _ESCAPE_NONE
+                self._unicode_buffer = ""
+
+        quote = -1
+        while index < length:
+            if quote < index:
+                quote = chunk.find('"', index)
+                if quote == -1:
+                    quote = length
+            backslash = chunk.find("\\", index, quote)
+            end = quote if backslash == -1 else backslash
+            if end > index:
+                decoded.append(chunk[index:end])
+            if backslash == -1:
+                index = quote
+                break
+
+            index = backslash + 1
+            if index == length:
+                self._escape_state = _ESCAPE_PENDING
+                break
+            ch = chunk[index]
+            if ch == "u":
+                hex_digits = chunk[index + 1 : index + 5]
+                if len(hex_digits) < 4:
+                    self._escape_state = _ESCAPE_UNICODE
+                    self._unicode_buffer = hex_digits
+                    index = length
+                    break
+                code_point = int(hex_digits, 16)
+                surrogate = surrogate or 0xD800 <= code_point <= 0xDFFF
+                decoded.append(chr(code_point))
+                index += 5
+            else:
+                code = ord(ch)
+                decoded.append(self._escape_lut[code] if code < 128 else ch)
+                index += 1
+
+        text = "".join(decoded)
+        if surrogate or self._high_surrogate:
+            text = self._pair_surrogates(text, hold=index == length)
+        if text:
+            if self._head or self._parts:
+                self._parts.append(text)
+            else:
+                self._head = text
+        return index, text
+
+    def _pair_surrogates(self, text: str, hold: bool) -> str:
+        # Joins UTF-16 surrogate pairs decoded from consecutive \uXXXX escapes.
+        # With `hold`, a trailing high surrogate is kept back until the next
+        # text shows whether its low half follows.
+        text = self._high_surrogate + text
+        self._high_surrogate = ""
+        if hold and text and "\ud800" <= text[-1] <= "\udbff":
+            self._high_surrogate = text[-1]
+            text = text[:-1]
+        return text.encode("utf-16-le", "surrogatepass").decode(
+            "utf-16-le", "surrogatepass"
+        )
 
     def is_terminating_quote(self, ch: str) -> bool:
-        if self._string_escape or self._is_parsing_unicode:
-            return False
-        if ch == '"':
-            return True
-        return False
+        return ch == '"' and self._escape_state == _ESCAPE_NONE
+
+    def flush(self) -> str:
+        """
+        Ends the string: a high surrogate that `push` held back waiting for its
+        low half is kept as is.
+
+        Returns:
+            The held back surrogate, or an empty string if there was none.
+        """
+        high_surrogate = self._high_surrogate
+        if high_surrogate:
+            self._high_surrogate = ""
+            self._parts.append(high_surrogate)
+        return high_surrogate
 
     def reset(self) -> None:
-        self._buffer = ""
-        self._string_escape = False
-        self._is_parsing_unicode = False
+        self._head = ""
+        self._parts.clear()
+        self._escape_state = _ESCAPE_NONE
         self._unicode_buffer = ""
+        self._high_surrogate = ""
 
     @property
     def buffer(self) -> str:
-        return self._buffer
+        # Fold pending fragments into `_head` on read, so a value that is read
+        # while it grows is not rejoined from single characters.
+        if self._parts:
+            self._head += "".join(self._parts)
+            self._parts.clear()
+        # A high surrogate still waiting for its pair is part of the value.
+        return self._head + self._high_surrogate
+
+
+class ReleasedDecoder(StringEscapeDecoder):
+    """
+    Placeholder for the decoder of a finished parser whose decoder went back to
+    the pool. Its buffer stays empty and it rejects any further input, so the
+    finished parser can no longer reach a decoder another parser now owns.
+    """
+
+    def push(self, ch: str) -> str | None:
+        raise ValueError("Cannot push into a released decoder.")
+
+    def push_chunk(self, chunk: str, start: int = 0) -> Tuple[int, str]:
+        raise ValueError("Cannot push into a released decoder.")
+
+
+RELEASED_DECODER = ReleasedDecoder()
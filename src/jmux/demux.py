@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import codecs
 from abc import ABC
 from enum import Enum
 from types import NoneType
 from typing import (
+    Dict,
     Generic,
+    List,
     Optional,
     Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
+    cast,
     get_args,
     get_origin,
     get_type_hints,
@@ -18,7 +23,7 @@ from typing import (
 from pydantic import BaseModel
 
 from jmux.awaitable import AwaitableValue, IAsyncSink, SinkType, StreamableValues
-from jmux.decoder import IDecoder, StringEscapeDecoder
+from jmux.decoder import RELEASED_DECODER, IDecoder, StringEscapeDecoder
 from jmux.error import (
     EmptyKeyError,
     ForbiddenTypeHintsError,
@@ -30,11 +35,11 @@ from jmux.error import (
     ObjectMissmatchedError,
     ParsePrimitiveError,
     TypeEmitError,
-    UnexpectedAttributeTypeError,
     UnexpectedCharacterError,
     UnexpectedStateError,
 )
 from jmux.helpers import (
+    deconstruct_flat_type,
     extract_types_from_generic_alias,
     get_main_type,
     str_to_bool,
@@ -44,7 +49,6 @@ from jmux.types import (
     ARRAY_CLOSE,
     ARRAY_OPEN,
     BOOLEAN_ALLOWED,
-    BOOLEAN_OPEN,
     COLON,
     COMMA,
     EXPECT_KEY_IN_ROOT,
@@ -56,12 +60,17 @@ from jmux.types import (
     JSON_TRUE,
     JSON_WHITESPACE,
     NULL_ALLOWED,
-    NULL_OPEN,
     NUMBER_OPEN,
+    NUMBER_RUN,
     OBJECT_CLOSE,
     OBJECT_OPEN,
     PARSING_PRIMITIVE_STATES,
-    QUOTE,
+    PRIMITIVE_END_IN_ARRAY,
+    PRIMITIVE_END_IN_ROOT,
+    STRING_BODY_STATES,
+    VALUE_OPEN_STATE,
+    WHITESPACE_RUN,
+    WHITESPACE_SKIP_STATES,
 )
 from jmux.types import Mode as M
 from jmux.types import State as S
@@ -73,49 +82,70 @@ T = TypeVar("T")
 
 
 class Sink(Generic[T]):
+    __slots__ = (
+        "_current_key",
+        "_current_sink",
+        "_current_kind",
+        "_current_class",
+        "_current_generics",
+        "_current_main_generic",
+        "_delegate",
+    )
+
     def __init__(self, delegate: "JMux"):
         self._current_key: Optional[str] = None
         self._current_sink: Optional[IAsyncSink[T]] = None
+        self._current_kind: Optional[SinkType] = None
+        self._current_class: Optional[type] = None
+        self._current_generics: Optional[Set[Type[T]]] = None
+        self._current_main_generic: Optional[Type[T]] = None
         self._delegate: "JMux" = delegate
 
     @property
     def current_sink_type(self) -> SinkType:
-        if self._current_sink is None:
+        if self._current_kind is None:
             raise NoCurrentSinkError()
-        return self._current_sink.get_sink_type()
+        return self._current_kind
 
     @property
     def current_underlying_generics(self) -> Set[Type[T]]:
-        if self._current_sink is None:
-            raise NoCurrentSinkError()
-        return self._current_sink.get_underlying_generics()
+        # Resolved on first use and kept until the next key, so values of the
+        # same field do not re-inspect `__orig_class__`.
+        if self._current_generics is None:
+            if self._current_sink is None:
+                raise NoCurrentSinkError()
+            self._current_generics = self._current_sink.get_underlying_generics()
+        return self._current_generics
 
     @property
     def current_underlying_main_generic(self) -> Type[T]:
-        if self._current_sink is None:
-            raise NoCurrentSinkError()
-        return self._current_sink.get_underlying_main_generic()
+        if self._current_main_generic is None:
+            if self._current_sink is None:
+                raise NoCurrentSinkError()
+            self._current_main_generic = (
+                self._current_sink.get_underlying_main_generic()
+            )
+        return self._current_main_generic
 
     def set_current(self, attr_name: str) -> None:
-        if not hasattr(self._delegate, attr_name):
+        # Sink types are validated when the JMux instantiates its fields.
+        sink = self._delegate._fields.get(attr_name)
+        if sink is None:
             raise MissingAttributeError(
                 object_name=self._delegate.__class__.__name__,
                 attribute=attr_name,
             )
-        sink = getattr(self._delegate, attr_name)
-        if not isinstance(sink, IAsyncSink):
-            raise UnexpectedAttributeTypeError(
-                attribute=attr_name,
-                object_name=type(sink).__name__,
-                expected_type="IAsyncSink",
-            )
         self._current_key = attr_name
         self._current_sink = sink
+        self._current_kind = sink.get_sink_type()
+        self._current_class = type(sink)
+        self._current_generics = None
+        self._current_main_generic = None
 
     async def emit(self, val: T) -> None:
         if self._current_sink is None:
             raise NoCurrentSinkError()
-        generics = self._current_sink.get_underlying_generics()
+        generics = self.current_underlying_generics
         if not any(
             isinstance(val, underlying_generic) for underlying_generic in generics
         ):
@@ -123,22 +153,46 @@ class Sink(Generic[T]):
                 expected_type=f"{generics}",
                 actual_type=f"{type(val).__name__}",
             )
+        # Neither built-in sink suspends, so skip the coroutine round-trip. Other
+        # IAsyncSink implementations go through the protocol methods.
+        if self._current_class is AwaitableValue:
+            cast(AwaitableValue, self._current_sink)._put_sync(val)
+            return
+        if self._current_class is StreamableValues:
+            cast(StreamableValues, self._current_sink)._put_sync(val)
+            return
         await self._current_sink.put(val)
 
     async def close(self) -> None:
         if self._current_sink is None:
             raise NoCurrentSinkError()
+        if self._current_class is AwaitableValue:
+            cast(AwaitableValue, self._current_sink)._close_sync()
+            return
+        if self._current_class is StreamableValues:
+            cast(StreamableValues, self._current_sink)._close_sync()
+            return
         await self._current_sink.close()
 
     async def ensure_closed(self) -> None:
         if self._current_sink is None:
             raise NoCurrentSinkError()
+        if self._current_class is AwaitableValue:
+            cast(AwaitableValue, self._current_sink)._ensure_closed_sync()
+            return
+        if self._current_class is StreamableValues:
+            cast(StreamableValues, self._current_sink)._ensure_closed_sync()
+            return
         await self._current_sink.ensure_closed()
 
     async def create_and_emit_nested(self) -> None:
         if self._current_sink is None:
             raise NoCurrentSinkError()
-        NestedJmux = self._current_sink.get_underlying_main_generic()
+        # JMux stores the nested type on the sinks it creates; sinks constructed
+        # elsewhere fall back to introspecting their generic.
+        NestedJmux = self._current_sink._underlying_type
+        if NestedJmux is None:
+            NestedJmux = self._current_sink.get_underlying_main_generic()
         if not issubclass(NestedJmux, JMux):
             raise TypeEmitError(
                 expected_type="JMux",
@@ -166,27 +220,81 @@ class JMux(ABC):
     which can be either AwaitableValue or StreamableValues.
     """
 
+    # Parser internals live in slots; the sink attributes declared by
+    # subclasses are set on the instance dict of each subclass.
+    __slots__ = (
+        "_fields",
+        "_pda",
+        "_decoder",
+        "_sink",
+        "_byte_decoder",
+        "_keyword",
+        "_keyword_position",
+    )
+
     def __init__(self):
         self._instantiate_attributes()
         self._pda: PushDownAutomata[M, S] = PushDownAutomata[M, S](S.START)
-        self._decoder: IDecoder = StringEscapeDecoder()
+        self._decoder: IDecoder = StringEscapeDecoder.acquire()
         self._sink = Sink[Emittable](self)
+        self._byte_decoder: codecs.IncrementalDecoder | None = None
+        # Literal being matched in the boolean and null states, and how many of
+        # its characters have been seen.
+        self._keyword = ""
+        self._keyword_position = 0
 
-    def _instantiate_attributes(self) -> None:
-        type_hints = get_type_hints(self.__class__)
-        for attr_name, type_alias in type_hints.items():
+    @classmethod
+    def _get_jmux_fields(
+        cls,
+    ) -> Tuple[Tuple[str, Type[IAsyncSink], Optional[Type[JMux]]], ...]:
+        # The schema is fixed once the class exists, so resolve the type hints
+        # once per subclass. This is deferred to first use so forward references
+        # defined after the class body still resolve.
+        fields = cls.__dict__.get("_jmux_fields")
+        if fields is not None:
+            return fields
+
+        resolved: List[Tuple[str, Type[IAsyncSink], Optional[Type[JMux]]]] = []
+        for attr_name, type_alias in get_type_hints(cls).items():
             TargetType = get_origin(type_alias)
             type_alias_args = get_args(type_alias)
             if len(type_alias_args) != 1:
                 raise TypeError(f"Generic type {type_alias} must be fully specified")
-            TargetGenericType = type_alias_args[0]
-            target_instance = TargetType[TargetGenericType]()
             if not issubclass(TargetType, IAsyncSink):
                 raise TypeError(
                     f"Attribute '{attr_name}' must conform to protocol IAsyncSink, "
                     f"got {TargetType}."
                 )
+            TargetGenericType = type_alias_args[0]
+            resolved.append(
+                (
+                    attr_name,
+                    TargetType[TargetGenericType],
+                    cls._resolve_nested_type(TargetGenericType),
+                )
+            )
+
+        fields = tuple(resolved)
+        cls._jmux_fields = fields
+        return fields
+
+    def _instantiate_attributes(self) -> None:
+        self._fields: Dict[str, IAsyncSink] = {}
+        for attr_name, SinkAlias, NestedType in self._get_jmux_fields():
+            target_instance = SinkAlias()
+            target_instance._underlying_type = NestedType
             setattr(self, attr_name, target_instance)
+            self._fields[attr_name] = target_instance
+
+    @staticmethod
+    def _resolve_nested_type(TargetGenericType: Type) -> Optional[Type["JMux"]]:
+        try:
+            MainType = get_main_type(deconstruct_flat_type(TargetGenericType))
+        except TypeError:
+            return None
+        if isinstance(MainType, type) and issubclass(MainType, JMux):
+            return MainType
+        return None
 
     @classmethod
     def assert_conforms_to(cls, pydantic_model: Type[BaseModel]) -> None:
@@ -433,8 +541,69 @@ class JMux(ABC):
             UnexpectedStateError: If the parser is in an unexpected state.
             EmptyKeyError: If an empty key is encountered in a JSON object.
         """
-        for ch in chunks:
+        index = 0
+        length = len(chunks)
+        # Keys and strings are only entered and left on a quote, and numbers
+        # are only entered on a digit or '-', so the parser state is read once
+        # up front and then only after feeding one of those, or to skip a run
+        # of whitespace.
+        in_string = self._pda.state in STRING_BODY_STATES
+        number_run = NUMBER_RUN.get(self._pda.state)
+        while index < length:
+            if in_string:
+                index, decoded = self._decoder.push_chunk(chunks, index)
+                if (
+                    decoded
+                    and self._pda.state is S.PARSING_STRING
+                    and self._pda.top is M.ROOT
+                    and self._sink.current_sink_type is SinkType.STREAMABLE_VALUES
+                ):
+                    await self._sink.emit(decoded)
+                if index == length:
+                    break
+            elif number_run is not None:
+                # Only characters the number state accepts are matched, so the
+                # run needs no per-character checks; its terminator is fed below.
+                end = number_run(chunks, index).end()
+                if end > index:
+                    self._decoder.push_chunk(chunks[index:end])
+                    index = end
+                number_run = None
+                if index == length:
+                    break
+            ch = chunks[index]
+            if ch in JSON_WHITESPACE and self._pda.state in WHITESPACE_SKIP_STATES:
+                index = WHITESPACE_RUN(chunks, index).end()
+                continue
             await self.feed_char(ch)
+            index += 1
+            if ch == '"':
+                in_string = self._pda.state in STRING_BODY_STATES
+            elif ch in NUMBER_OPEN:
+                number_run = NUMBER_RUN.get(self._pda.state)
+
+    async def feed_bytes(self, data: bytes | bytearray | memoryview) -> None:
+        """
+        Feeds UTF-8 encoded bytes to the JMux parser. A multi-byte character
+        split across calls is held back until its remaining bytes arrive.
+
+        Args:
+            data: The bytes to feed. Any bytes-like object, such as a
+                `memoryview` into a receive buffer, is decoded without copying
+                it to `bytes` first.
+
+        Raises:
+            UnicodeDecodeError: If `data` is not valid UTF-8.
+            UnexpectedCharacterError: If an unexpected character is encountered.
+            ObjectAlreadyClosedError: If the JMux object is already closed.
+            UnexpectedStateError: If the parser is in an unexpected state.
+            EmptyKeyError: If an empty key is encountered in a JSON object.
+        """
+        if self._byte_decoder is None:
+            self._byte_decoder = codecs.getincrementaldecoder("utf-8")()
+        chunks = self._byte_decoder.decode(data)
+        if chunks:
+            await self.feed_chunks(chunks)
 
     async def feed_char(self, ch: str) -> None:
         """
@@ -456,10 +625,30 @@ class JMux(ABC):
                 pda_state=self._pda.state,
                 message="Only single characters are allowed to be fed to JMux.",
             )
-        match self._pda.top:
+        # Read once; every branch below either leaves the PDA untouched before
+        # its last use of these or re-reads it after a transition.
+        state = self._pda._state
+        stack = self._pda._stack
+        top = stack[-1] if stack else None
+        # Most characters of a typical stream are string content of a root
+        # value, so that case skips the dispatch below. Terminating quotes
+        # still take the full path to emit and close the sink.
+        if (
+            state is S.PARSING_STRING
+            and top is M.ROOT
+            and not self._decoder.is_terminating_quote(ch)
+        ):
+            maybe_char = self._decoder.push(ch)
+            if (
+                maybe_char is not None
+                and self._sink.current_sink_type is SinkType.STREAMABLE_VALUES
+            ):
+                await self._sink.emit(maybe_char)
+            return
+        match top:
             # CONTEXT: Start
             case None:
-                match self._pda.state:
+                match state:
                     case S.START:
                         if ch in JSON_WHITESPACE:
                             pass
@@ -496,15 +685,15 @@ class JMux(ABC):
 
             # CONTEXT: Root
             case M.ROOT:
-                match self._pda.state:
-                    case _ if self._pda.state in EXPECT_KEY_IN_ROOT:
+                match state:
+                    case _ if state in EXPECT_KEY_IN_ROOT:
                         if ch in JSON_WHITESPACE:
                             pass
                         elif ch == '"':
                             self._pda.set_state(S.PARSING_KEY)
                             self._decoder.reset()
                         elif ch in OBJECT_CLOSE:
-                            if self._pda.state is S.EXPECT_KEY_AFTER_COMMA:
+                            if state is S.EXPECT_KEY_AFTER_COMMA:
                                 raise UnexpectedCharacterError(
                                     ch,
                                     self._pda.stack,
@@ -581,34 +770,30 @@ class JMux(ABC):
                             )
 
                     case S.PARSING_STRING:
-                        if self._decoder.is_terminating_quote(ch):
-                            if self._sink.current_sink_type == SinkType.AWAITABLE_VALUE:
-                                MainType = self._sink.current_underlying_main_generic
-                                if issubclass(MainType, Enum):
-                                    try:
-                                        value = MainType(self._decoder.buffer)
-                                        await self._sink.emit(value)
-                                    except ValueError as e:
-                                        raise ParsePrimitiveError(
-                                            f"Invalid enum value: "
-                                            f"{self._decoder.buffer}"
-                                        ) from e
-                                else:
-                                    await self._sink.emit(self._decoder.buffer)
-                            self._decoder.reset()
-                            await self._sink.close()
-                            self._pda.set_state(S.EXPECT_COMMA_OR_EOC)
-                        else:
-                            maybe_char = self._decoder.push(ch)
-                            if (
-                                maybe_char is not None
-                                and self._sink.current_sink_type
-                                is SinkType.STREAMABLE_VALUES
-                            ):
-                                await self._sink.emit(maybe_char)
+                        # Only the terminating quote gets here, string content
+                        # is handled by the fast path above.
+                        if self._sink.current_sink_type == SinkType.AWAITABLE_VALUE:
+                            MainType = self._sink.current_underlying_main_generic
+                            if issubclass(MainType, Enum):
+                                try:
+                                    value = MainType(self._decoder.buffer)
+                                    await self._sink.emit(value)
+                                except ValueError as e:
+                                    raise ParsePrimitiveError(
+                                        f"Invalid enum value: {self._decoder.buffer}"
+                                    ) from e
+                            else:
+                                await self._sink.emit(self._decoder.buffer)
+                        # A lone high surrogate at the end was held back by
+                        # `push` and still has to be streamed.
+                        elif held_back := self._decoder.flush():
+                            await self._sink.emit(held_back)
+                        self._decoder.reset()
+                        await self._sink.close()
+                        self._pda.set_state(S.EXPECT_COMMA_OR_EOC)
 
-                    case _ if self._pda.state in PARSING_PRIMITIVE_STATES:
-                        if ch in COMMA | OBJECT_CLOSE | JSON_WHITESPACE:
+                    case _ if state in PARSING_PRIMITIVE_STATES:
+                        if ch in PRIMITIVE_END_IN_ROOT:
                             await self._parse_primitive()
                             await self._sink.close()
                             self._decoder.reset()
@@ -654,14 +839,14 @@ class JMux(ABC):
                         "No support for 2-dimensional arrays.",
                     )
 
-                match self._pda.state:
-                    case _ if self._pda.state in EXPECT_VALUE_IN_ARRAY:
+                match state:
+                    case _ if state in EXPECT_VALUE_IN_ARRAY:
                         if ch in JSON_WHITESPACE:
                             pass
                         elif await self._handle_common__expect_value(ch):
                             pass
                         elif ch in ARRAY_CLOSE:
-                            if self._pda.state is S.EXPECT_VALUE_AFTER_COMMA:
+                            if state is S.EXPECT_VALUE_AFTER_COMMA:
                                 raise UnexpectedCharacterError(
                                     ch,
                                     self._pda.stack,
@@ -705,8 +890,8 @@ class JMux(ABC):
                         else:
                             self._decoder.push(ch)
 
-                    case _ if self._pda.state in PARSING_PRIMITIVE_STATES:
-                        if ch in COMMA | ARRAY_CLOSE | JSON_WHITESPACE:
+                    case _ if state in PARSING_PRIMITIVE_STATES:
+                        if ch in PRIMITIVE_END_IN_ARRAY:
                             await self._parse_primitive()
                             self._decoder.reset()
                             if ch in COMMA:
@@ -743,7 +928,7 @@ class JMux(ABC):
 
             # CONTEXT: Object
             case M.OBJECT:
-                if self._pda.state is not S.PARSING_OBJECT:
+                if state is not S.PARSING_OBJECT:
                     raise UnexpectedCharacterError(
                         ch,
                         self._pda.stack,
@@ -751,7 +936,7 @@ class JMux(ABC):
                         "State in object context must be 'parsing_object'",
                     )
                 if ch in OBJECT_OPEN:
-                    if self._pda.top is M.OBJECT:
+                    if top is M.OBJECT:
                         await self._sink.forward_char(ch)
                     self._pda.push(M.OBJECT)
                 elif ch in OBJECT_CLOSE:
@@ -788,9 +973,14 @@ class JMux(ABC):
             await self._sink.emit(value)
 
     async def _handle_common__expect_value(self, ch: str) -> S | None:
+        # Whitespace, '[' and ']' are handled by the caller; only resolve the
+        # sink generics once the character actually starts a value.
+        opened = VALUE_OPEN_STATE.get(ch)
+        if opened is None:
+            return None
         generic_set = self._sink.current_underlying_generics
         generic = self._sink.current_underlying_main_generic
-        if ch in QUOTE:
+        if opened is S.PARSING_STRING:
             if not (str in generic_set or issubclass(generic, Enum)):
                 raise UnexpectedCharacterError(
                     ch,
@@ -804,7 +994,7 @@ class JMux(ABC):
             self._pda.set_state(S.PARSING_STRING)
             self._decoder.reset()
             return S.PARSING_STRING
-        if ch in NUMBER_OPEN:
+        if opened is S.PARSING_INTEGER:
             if not any(t in generic_set for t in (int, float)):
                 raise UnexpectedCharacterError(
                     ch,
@@ -822,7 +1012,7 @@ class JMux(ABC):
             else:
                 self._pda.set_state(S.PARSING_FLOAT)
                 return S.PARSING_FLOAT
-        if ch in BOOLEAN_OPEN:
+        if opened is S.PARSING_BOOLEAN:
             if bool not in generic_set:
                 raise UnexpectedCharacterError(
                     ch,
@@ -835,8 +1025,10 @@ class JMux(ABC):
                 )
             self._pda.set_state(S.PARSING_BOOLEAN)
             self._decoder.push(ch)
+            self._keyword = JSON_TRUE if ch == "t" else JSON_FALSE
+            self._keyword_position = 1
             return S.PARSING_BOOLEAN
-        if ch in NULL_OPEN:
+        if opened is S.PARSING_NULL:
             if NoneType not in generic_set:
                 raise UnexpectedCharacterError(
                     ch,
@@ -849,8 +1041,10 @@ class JMux(ABC):
                 )
             self._pda.set_state(S.PARSING_NULL)
             self._decoder.push(ch)
+            self._keyword = JSON_NULL
+            self._keyword_position = 1
             return S.PARSING_NULL
-        if ch in OBJECT_OPEN:
+        if opened is S.PARSING_OBJECT:
             if not issubclass(generic, JMux):
                 raise UnexpectedCharacterError(
                     ch,
@@ -873,8 +1067,7 @@ class JMux(ABC):
         self._pda.set_state(new_state)
 
     async def _finalize(self) -> None:
-        type_hints = get_type_hints(self.__class__)
-        for attr_name, _ in type_hints.items():
+        for attr_name in self._fields:
             self._sink.set_current(attr_name)
             try:
                 await self._sink.ensure_closed()
@@ -886,6 +1079,23 @@ class JMux(ABC):
 
         self._pda.pop()
         self._pda.set_state(S.END)
+        # Only decoders of finalized objects return to the pool; a nested
+        # object whose parent never forwards its closing brace keeps its own.
+        # The reference is dropped, so this object cannot reach the decoder
+        # once another parser acquires it.
+        if type(self._decoder) is StringEscapeDecoder:
+            StringEscapeDecoder.release(self._decoder)
+            self._decoder = RELEASED_DECODER
+
+    def _advance_keyword(self, ch: str) -> bool:
+        # `true`, `false` and `null` each allow exactly one next character, so
+        # matching is a single compare against the keyword chosen on entry.
+        position = self._keyword_position
+        keyword = self._keyword
+        if position < len(keyword) and keyword[position] == ch:
+            self._keyword_position = position + 1
+            return True
+        return False
 
     def _assert_primitive_character_allowed_in_state(self, ch: str) -> None:
         if self._pda.state is S.PARSING_INTEGER:
@@ -905,17 +1115,14 @@ class JMux(ABC):
                     "Trying to parse 'float' but received unexpected character.",
                 )
         elif self._pda.state is S.PARSING_BOOLEAN:
-            if ch not in BOOLEAN_ALLOWED:
-                raise UnexpectedCharacterError(
-                    ch,
-                    self._pda.stack,
-                    self._pda.state,
-                    "Trying to parse 'boolean' but received unexpected character.",
-                )
-            if not any(
-                bool_str.startswith(f"{self._decoder.buffer}{ch}")
-                for bool_str in (JSON_TRUE, JSON_FALSE)
-            ):
+            if not self._advance_keyword(ch):
+                if ch not in BOOLEAN_ALLOWED:
+                    raise UnexpectedCharacterError(
+                        ch,
+                        self._pda.stack,
+                        self._pda.state,
+                        "Trying to parse 'boolean' but received unexpected character.",
+                    )
                 raise UnexpectedCharacterError(
                     ch,
                     self._pda.stack,
@@ -926,14 +1133,14 @@ class JMux(ABC):
                     ),
                 )
         elif self._pda.state is S.PARSING_NULL:
-            if ch not in NULL_ALLOWED:
-                raise UnexpectedCharacterError(
-                    ch,
-                    self._pda.stack,
-                    self._pda.state,
-                    "Trying to parse 'null' but received unexpected character.",
-                )
-            if not JSON_NULL.startswith(f"{self._decoder.buffer}{ch}"):
+            if not self._advance_keyword(ch):
+                if ch not in NULL_ALLOWED:
+                    raise UnexpectedCharacterError(
+                        ch,
+                        self._pda.stack,
+                        self._pda.state,
+                        "Trying to parse 'null' but received unexpected character.",
+                    )
                 raise UnexpectedCharacterError(
                     ch,
                     self._pda.stack,
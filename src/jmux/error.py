@@ -1,7 +1,16 @@
-from enum import Enum
+from enum import Enum, IntEnum
 from typing import Sequence
 
 
+def _describe_pda_value(item: Enum | str) -> str:
+    # Int-valued PDA enums carry their readable name in `str()`.
+    if isinstance(item, IntEnum):
+        return str(item)
+    if isinstance(item, Enum):
+        return item.value
+    return item
+
+
 class MissingAttributeError(Exception):
     def __init__(self, object_name: str, attribute: str) -> None:
         super().__init__(f"'{object_name}' is missing required attribute '{attribute}'")
@@ -108,10 +117,8 @@ class UnexpectedCharacterError(Exception):
         pda_state: Enum | str,
         message: str | None,
     ) -> None:
-        pda_stack_str = [
-            item.value if isinstance(item, Enum) else item for item in pda_stack
-        ]
-        pda_state_str = pda_state.value if isinstance(pda_state, Enum) else pda_state
+        pda_stack_str = [_describe_pda_value(item) for item in pda_stack]
+        pda_state_str = _describe_pda_value(pda_state)
         super().__init__(
             f"Received unexpected character '{character}' in state '{pda_state_str}' "
             f"with stack {pda_stack_str}" + (f": {message}" if message else "")
@@ -131,10 +138,8 @@ class UnexpectedStateError(Exception):
         pda_state: Enum | str,
         message: str | None = None,
     ) -> None:
-        pda_stack_str = [
-            item.value if isinstance(item, Enum) else item for item in pda_stack
-        ]
-        pda_state_str = pda_state.value if isinstance(pda_state, Enum) else pda_state
+        pda_stack_str = [_describe_pda_value(item) for item in pda_stack]
+        pda_state_str = _describe_pda_value(pda_state)
         super().__init__(
             f"Unexpected state '{pda_state_str}' with stack {pda_stack_str}"
             + (f": {message}" if message else "")
@@ -1,17 +1,39 @@
 from __future__ import annotations
 
 import ast
+import functools
 import importlib.util
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
 from types import ModuleType, NoneType, UnionType
-from typing import Annotated, Any, Union, get_args, get_origin, get_type_hints
+from typing import (
+    Annotated,
+    Any,
+    Iterable,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 from pydantic import BaseModel
 
 from jmux.base import StreamableBaseModel, Streamed
 
+_PARALLEL_SCAN_MIN_FILES = 256
+_PARALLEL_SCAN_CHUNKSIZE = 16
+
+_SIMPLE_TYPE_NAMES: dict[Any, str] = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    NoneType: "None",
+    None: "None",
+}
+
 
 def extract_models_from_source(
     source: str,
@@ -31,12 +53,9 @@ def find_streamable_models(root_path: Path) -> list[type[StreamableBaseModel]]:
     models: list[type[StreamableBaseModel]] = []
     root_path = root_path.resolve()
 
-    for py_file in root_path.rglob("*.py"):
-        source = _read_file_safe(py_file)
-        if source is None:
-            continue
-
-        if not _source_imports_streamable_base_model(source):
+    py_files = list(root_path.rglob("*.py"))
+    for py_file, is_candidate in zip(py_files, _scan_candidates(py_files)):
+        if not is_candidate:
             continue
 
         module = _import_module_from_path(py_file, root_path)
@@ -48,6 +67,24 @@ def find_streamable_models(root_path: Path) -> list[type[StreamableBaseModel]]:
     return models
 
 
+def _scan_candidates(py_files: list[Path]) -> Iterable[bool]:
+    # Reading and filtering are independent per file; importing is not, since
+    # model classes cannot cross process boundaries, so only this part fans out.
+    if len(py_files) < _PARALLEL_SCAN_MIN_FILES:
+        return map(_is_candidate_file, py_files)
+    with ProcessPoolExecutor() as executor:
+        return list(
+            executor.map(
+                _is_candidate_file, py_files, chunksize=_PARALLEL_SCAN_CHUNKSIZE
+            )
+        )
+
+
+def _is_candidate_file(py_file: Path) -> bool:
+    source = _read_file_safe(py_file)
+    return source is not None and _source_imports_streamable_base_model(source)
+
+
 def _extract_models_from_module(
     module: ModuleType,
 ) -> list[type[StreamableBaseModel]]:
@@ -71,6 +108,10 @@ def _read_file_safe(py_file: Path) -> str | None:
 
 
 def _source_imports_streamable_base_model(source: str) -> bool:
+    # Every accepted import names a jmux module; skip parsing when none can.
+    if "jmux" not in source:
+        return False
+
     try:
         tree = ast.parse(source)
     except SyntaxError:
@@ -130,6 +171,7 @@ def _is_streamed_marker(obj: Any) -> bool:
     return False
 
 
+@functools.lru_cache(maxsize=None)
 def _get_resolved_annotations(model: type[StreamableBaseModel]) -> dict[str, Any]:
     try:
         globalns = getattr(sys.modules.get(model.__module__, None), "__dict__", {})
@@ -148,18 +190,22 @@ def generate_jmux_code(models: list[type[StreamableBaseModel]]) -> str:
         "",
     ]
 
-    enum_imports = _collect_enum_imports(models)
-    if enum_imports:
-        lines.extend(enum_imports)
-        lines.append("")
-
-    nested_models = _collect_nested_models(models)
-    all_models = _topological_sort(models, nested_models)
-
-    for model in all_models:
-        class_lines = _generate_class(model)
-        lines.extend(class_lines)
-        lines.append("")
+    try:
+        enum_imports = _collect_enum_imports(models)
+        if enum_imports:
+            lines.extend(enum_imports)
+            lines.append("")
+
+        nested_models = _collect_nested_models(models)
+        all_models = _topological_sort(models, nested_models)
+
+        for model in all_models:
+            class_lines = _generate_class(model)
+            lines.extend(class_lines)
+            lines.append("")
+    finally:
+        # Resolved hints are only reused within one run; do not pin model classes.
+        _get_resolved_annotations.cache_clear()
 
     return "\n".join(lines)
 
@@ -245,26 +291,41 @@ def _topological_sort(
     result: list[type[StreamableBaseModel]] = []
     visited: set[type[StreamableBaseModel]] = set()
 
-    def visit(model: type[StreamableBaseModel]) -> None:
-        if model in visited:
-            return
-        visited.add(model)
-        resolved = _get_resolved_annotations(model)
-        for field_name in model.model_fields:
-            annotation = resolved.get(field_name)
-            if annotation is None:
-                continue
-            dep = _get_nested_model_dependency(annotation)
-            if dep and dep in all_models:
-                visit(dep)
-        result.append(model)
-
-    for model in all_models:
-        visit(model)
+    for root in all_models:
+        if root in visited:
+            continue
+        visited.add(root)
+        stack = [(root, iter(_model_dependencies(root, all_models)))]
+        while stack:
+            model, deps = stack[-1]
+            for dep in deps:
+                if dep not in visited:
+                    visited.add(dep)
+                    stack.append((dep, iter(_model_dependencies(dep, all_models))))
+                    break
+            else:
+                stack.pop()
+                result.append(model)
 
     return result
 
 
+def _model_dependencies(
+    model: type[StreamableBaseModel],
+    all_models: set[type[StreamableBaseModel]],
+) -> list[type[StreamableBaseModel]]:
+    deps: list[type[StreamableBaseModel]] = []
+    resolved = _get_resolved_annotations(model)
+    for field_name in model.model_fields:
+        annotation = resolved.get(field_name)
+        if annotation is None:
+            continue
+        dep = _get_nested_model_dependency(annotation)
+        if dep and dep in all_models:
+            deps.append(dep)
+    return deps
+
+
 def _get_nested_model_dependency(annotation: Any) -> type[StreamableBaseModel] | None:
     origin = get_origin(annotation)
     args = get_args(annotation)
@@ -327,20 +388,9 @@ def get_jmux_type(annotation: Any) -> str:
         inner_jmux = _get_inner_type_str(inner)
         return f"StreamableValues[{inner_jmux}]"
 
-    if annotation is str:
-        return "AwaitableValue[str]"
-
-    if annotation is int:
-        return "AwaitableValue[int]"
-
-    if annotation is float:
-        return "AwaitableValue[float]"
-
-    if annotation is bool:
-        return "AwaitableValue[bool]"
-
-    if annotation is NoneType or annotation is None:
-        return "AwaitableValue[None]"
+    simple = _SIMPLE_TYPE_NAMES.get(annotation) if _is_plain_type(annotation) else None
+    if simple is not None:
+        return f"AwaitableValue[{simple}]"
 
     if isinstance(annotation, type) and issubclass(annotation, Enum):
         return f"AwaitableValue[{annotation.__name__}]"
@@ -362,16 +412,9 @@ def get_jmux_type(annotation: Any) -> str:
 
 
 def _get_inner_type_str(annotation: Any) -> str:
-    if annotation is str:
-        return "str"
-    if annotation is int:
-        return "int"
-    if annotation is float:
-        return "float"
-    if annotation is bool:
-        return "bool"
-    if annotation is NoneType or annotation is None:
-        return "None"
+    simple = _SIMPLE_TYPE_NAMES.get(annotation) if _is_plain_type(annotation) else None
+    if simple is not None:
+        return simple
     if isinstance(annotation, type) and issubclass(annotation, Enum):
         return annotation.__name__
     if isinstance(annotation, type) and issubclass(annotation, BaseModel):
@@ -379,3 +422,9 @@ def _get_inner_type_str(annotation: Any) -> str:
             return f"{annotation.__name__}JMux"
         return annotation.__name__
     return str(annotation)
+
+
+def _is_plain_type(annotation: Any) -> bool:
+    # Generic aliases may carry unhashable arguments; only classes and None
+    # are looked up in _SIMPLE_TYPE_NAMES.
+    return annotation is None or isinstance(annotation, type)
@@ -1,9 +1,14 @@
+import functools
 from types import NoneType
-from typing import Set, Tuple, Type, get_args, get_origin
+from typing import FrozenSet, Set, Tuple, Type, get_args, get_origin
 
 from jmux.error import ParsePrimitiveError
 from jmux.types import TYPES_LIKE_NONE, TYPES_LIKE_UNION
 
+# Bound on the cached type hints, so hints of classes that are created at runtime
+# do not accumulate in long-running processes.
+_TYPE_CACHE_SIZE = 1024
+
 
 def str_to_bool(s: str) -> bool:
     if s == "true":
@@ -18,20 +23,35 @@ def str_to_bool(s: str) -> bool:
 
 
 def extract_types_from_generic_alias(UnknownType: Type) -> Tuple[Set[Type], Set[Type]]:
+    main_types, sub_types = _extract_types_from_generic_alias(UnknownType)
+    return set(main_types), set(sub_types)
+
+
+def deconstruct_flat_type(UnknownType: Type) -> Set[Type]:
+    return set(_deconstruct_flat_type(UnknownType))
+
+
+# The introspection below only depends on the type hint, so it is done once per
+# hint. The cached results are frozen and the public wrappers above hand out
+# fresh sets, since callers are free to mutate what they get back.
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _extract_types_from_generic_alias(
+    UnknownType: Type,
+) -> Tuple[FrozenSet[Type], FrozenSet[Type]]:
     Origin: Type | None = get_origin(UnknownType)
     if Origin is None:
-        return {UnknownType}, set()
+        return frozenset((UnknownType,)), frozenset()
     if Origin in TYPES_LIKE_UNION:
-        deconstructed = deconstruct_flat_type(UnknownType)
+        deconstructed = _deconstruct_flat_type(UnknownType)
         maybe_list_types = [
             subtypes for subtypes in deconstructed if get_origin(subtypes) is list
         ]
         if len(maybe_list_types) == 1:
             list_based_type = maybe_list_types[0]
             non_list_types = deconstructed - {list_based_type}
-            main_type, subtype = extract_types_from_generic_alias(list_based_type)
+            main_type, subtype = _extract_types_from_generic_alias(list_based_type)
             return non_list_types | main_type, subtype
-        return deconstructed, set()
+        return deconstructed, frozenset()
 
     type_args = get_args(UnknownType)
     if len(type_args) != 1:
@@ -41,9 +61,9 @@ def extract_types_from_generic_alias(UnknownType: Type) -> Tuple[Set[Type], Set[
         )
 
     Generic: Type = type_args[0]
-    type_set = deconstruct_flat_type(Generic)
+    type_set = _deconstruct_flat_type(Generic)
     if len(type_set) == 1:
-        return {Origin}, type_set
+        return frozenset((Origin,)), type_set
     if len(type_set) != 2:
         raise TypeError(
             f"Union type must have exactly two types in its union, "
@@ -53,18 +73,19 @@ def extract_types_from_generic_alias(UnknownType: Type) -> Tuple[Set[Type], Set[
         raise TypeError(
             "Union type must include NoneType if it is used as a generic argument."
         )
-    return {Origin}, type_set
+    return frozenset((Origin,)), type_set
 
 
-def deconstruct_flat_type(UnknownType: Type) -> Set[Type]:
+@functools.lru_cache(maxsize=_TYPE_CACHE_SIZE)
+def _deconstruct_flat_type(UnknownType: Type) -> FrozenSet[Type]:
     Origin: Type | None = get_origin(UnknownType)
     if UnknownType in TYPES_LIKE_NONE:
-        return {NoneType}
+        return frozenset((NoneType,))
     if Origin is None:
-        return {UnknownType}
+        return frozenset((UnknownType,))
     if Origin in TYPES_LIKE_UNION:
         type_args = get_args(UnknownType)
-        return set(type_args)
+        return frozenset(type_args)
     raise TypeError(
         f"Unknown type {UnknownType} is not a Union or optional type, "
         "only only those types and their syntactic sugar are supported "
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from typing import Generic, List, Optional, TypeVar
+from typing import Callable, Generic, List, Optional, TypeVar
 
 Context = TypeVar("Context")
 State = TypeVar("State")
 
 
 class PushDownAutomata(Generic[Context, State]):
+    __slots__ = ("_stack", "_state", "push")
+
+    push: Callable[[Context], None]
+
     def __init__(self, start_state: State) -> None:
         self._stack: List[Context] = []
         self._state: State = start_state
+        # Bound once so pushes skip the Python-level method frame.
+        self.push = self._stack.append
 
     @property
     def state(self) -> State:
@@ -21,16 +27,11 @@ class PushDownAutomata(Generic[Context, State]):
 
     @property
     def top(self) -> Optional[Context]:
-        if not self._stack:
-            return None
-        return self._stack[-1]
+        return self._stack[-1] if self._stack else None
 
     def set_state(self, new_state: State) -> None:
         self._state = new_state
 
-    def push(self, mode: Context) -> None:
-        self._stack.append(mode)
-
     def pop(self) -> Context:
         if not self._stack:
             raise IndexError("PDA stack is empty.")
@@ -1,67 +1,116 @@
-from enum import Enum
+import re
+from enum import IntEnum
 from types import NoneType, UnionType
-from typing import List, Set, Union
+from typing import Dict, FrozenSet, List, Union
 
 
-class State(Enum):
-    START = "start"
-    END = "end"
-    ERROR = "error"
+class State(IntEnum):
+    # Int-valued so that the per-character state checks hash and compare as
+    # plain ints; `str()` is the lower-case name that errors report.
+    START = 0
+    END = 1
+    ERROR = 2
     # expect
-    EXPECT_KEY = "expect_key"
-    EXPECT_KEY_AFTER_COMMA = "expect_key_after_comma"
-    EXPECT_COLON = "expect_colon"
-    EXPECT_VALUE = "expect_value"
-    EXPECT_VALUE_AFTER_COMMA = "expect_value_after_comma"
-    EXPECT_COMMA_OR_EOC = "expect_comma_or_eoc"
+    EXPECT_KEY = 3
+    EXPECT_KEY_AFTER_COMMA = 4
+    EXPECT_COLON = 5
+    EXPECT_VALUE = 6
+    EXPECT_VALUE_AFTER_COMMA = 7
+    EXPECT_COMMA_OR_EOC = 8
     # parsing
-    PARSING_KEY = "parsing_key"
-    PARSING_STRING = "parsing_string"
-    PARSING_INTEGER = "parsing_integer"
-    PARSING_FLOAT = "parsing_float"
-    PARSING_BOOLEAN = "parsing_boolean"
-    PARSING_NULL = "parsing_null"
-    PARSING_OBJECT = "parsing_object"
-
-
-PARSING_PRIMITIVE_STATES: Set[State] = {
-    State.PARSING_INTEGER,
-    State.PARSING_FLOAT,
-    State.PARSING_BOOLEAN,
-    State.PARSING_NULL,
-}
+    PARSING_KEY = 9
+    PARSING_STRING = 10
+    PARSING_INTEGER = 11
+    PARSING_FLOAT = 12
+    PARSING_BOOLEAN = 13
+    PARSING_NULL = 14
+    PARSING_OBJECT = 15
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+
+PARSING_PRIMITIVE_STATES: FrozenSet[State] = frozenset(
+    {
+        State.PARSING_INTEGER,
+        State.PARSING_FLOAT,
+        State.PARSING_BOOLEAN,
+        State.PARSING_NULL,
+    }
+)
+
+EXPECT_KEY_IN_ROOT = frozenset({State.EXPECT_KEY, State.EXPECT_KEY_AFTER_COMMA})
+EXPECT_VALUE_IN_ARRAY = frozenset({State.EXPECT_VALUE, State.EXPECT_VALUE_AFTER_COMMA})
+STRING_BODY_STATES = frozenset({State.PARSING_KEY, State.PARSING_STRING})
+# States in which JSON whitespace is read and ignored, in any context.
+WHITESPACE_SKIP_STATES = frozenset(
+    {
+        State.START,
+        State.END,
+        State.EXPECT_KEY,
+        State.EXPECT_KEY_AFTER_COMMA,
+        State.EXPECT_COLON,
+        State.EXPECT_VALUE,
+        State.EXPECT_VALUE_AFTER_COMMA,
+        State.EXPECT_COMMA_OR_EOC,
+    }
+)
 
-EXPECT_KEY_IN_ROOT = {State.EXPECT_KEY, State.EXPECT_KEY_AFTER_COMMA}
-EXPECT_VALUE_IN_ARRAY = {State.EXPECT_VALUE, State.EXPECT_VALUE_AFTER_COMMA}
 
+class Mode(IntEnum):
+    # Small ints keep stack pushes and comparisons on C-level int hashing and
+    # equality; `str()` gives the name used in error messages.
+    ROOT = 0
+    OBJECT = 1
+    ARRAY = 2
 
-class Mode(Enum):
-    ROOT = "$"
-    OBJECT = "object"
-    ARRAY = "array"
+    def __str__(self) -> str:
+        return _MODE_LABELS[self]
 
 
-OBJECT_OPEN = set("{")
-OBJECT_CLOSE = set("}")
-COLON = set(":")
-ARRAY_OPEN = set("[")
-ARRAY_CLOSE = set("]")
-COMMA = set(",")
-QUOTE = set('"')
+_MODE_LABELS = {Mode.ROOT: "$", Mode.OBJECT: "object", Mode.ARRAY: "array"}
 
-NUMBER_OPEN = set("0123456789-")
-BOOLEAN_OPEN = set("tf")
-NULL_OPEN = set("n")
 
-INTERGER_ALLOWED = set("0123456789")
-FLOAT_ALLOWED = set("0123456789-+eE.")
-BOOLEAN_ALLOWED = set("truefals")
-NULL_ALLOWED = set("nul")
+OBJECT_OPEN = frozenset("{")
+OBJECT_CLOSE = frozenset("}")
+COLON = frozenset(":")
+ARRAY_OPEN = frozenset("[")
+ARRAY_CLOSE = frozenset("]")
+COMMA = frozenset(",")
+QUOTE = frozenset('"')
+
+NUMBER_OPEN = frozenset("0123456789-")
+BOOLEAN_OPEN = frozenset("tf")
+NULL_OPEN = frozenset("n")
+# Character class table for the first character of a value, mapped to the
+# state it opens. Numbers open as integers until the sink's generic says float.
+VALUE_OPEN_STATE: Dict[str, State] = {
+    **dict.fromkeys(QUOTE, State.PARSING_STRING),
+    **dict.fromkeys(NUMBER_OPEN, State.PARSING_INTEGER),
+    **dict.fromkeys(BOOLEAN_OPEN, State.PARSING_BOOLEAN),
+    **dict.fromkeys(NULL_OPEN, State.PARSING_NULL),
+    **dict.fromkeys(OBJECT_OPEN, State.PARSING_OBJECT),
+}
+
+INTERGER_ALLOWED = frozenset("0123456789")
+FLOAT_ALLOWED = frozenset("0123456789-+eE.")
+# Matchers for a run of characters a number may continue with, by state.
+NUMBER_RUN = {
+    State.PARSING_INTEGER: re.compile("[0-9]*").match,
+    State.PARSING_FLOAT: re.compile(r"[0-9\-+eE.]*").match,
+}
+BOOLEAN_ALLOWED = frozenset("truefals")
+NULL_ALLOWED = frozenset("nul")
 
 JSON_FALSE = "false"
 JSON_TRUE = "true"
 JSON_NULL = "null"
-JSON_WHITESPACE = set(" \t\n\r")
+JSON_WHITESPACE = frozenset(" \t\n\r")
+WHITESPACE_RUN = re.compile("[ \t\n\r]+").match
+
+# Characters that end a primitive value in an object or an array.
+PRIMITIVE_END_IN_ROOT = COMMA | OBJECT_CLOSE | JSON_WHITESPACE
+PRIMITIVE_END_IN_ARRAY = COMMA | ARRAY_CLOSE | JSON_WHITESPACE
 
 TYPES_LIKE_UNION = {UnionType, Union}
 TYPES_LIKE_NONE = {NoneType, None}
@@ -1,6 +1,7 @@
 from types import NoneType
 from typing import Set, Type
 
+import anyio
 import pytest
 
 from jmux.awaitable import (
@@ -309,6 +310,40 @@ async def test_streamable_values__empty_stream_iteration():
     assert items == []
 
 
+@pytest.mark.anyio
+async def test_streamable_values__none_items_before_close():
+    sv = StreamableValues[NoneType]()
+    await sv.put(None)
+    await sv.put(None)
+    await sv.close()
+
+    items = []
+    async for item in sv:
+        items.append(item)
+
+    assert items == [None, None]
+
+
+@pytest.mark.anyio
+async def test_streamable_values__consumer_waits_for_producer():
+    sv = StreamableValues[int]()
+    items = []
+
+    async def consume():
+        async for item in sv:
+            items.append(item)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(consume)
+        await anyio.sleep(0)
+        await sv.put(1)
+        await anyio.sleep(0)
+        await sv.put(2)
+        await sv.close()
+
+    assert items == [1, 2]
+
+
 @pytest.mark.anyio
 async def test_streamable_values__large_number_of_items():
     sv = StreamableValues[int]()
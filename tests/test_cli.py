@@ -3,26 +3,32 @@ import sys
 import tempfile
 from pathlib import Path
 
+import pytest
 
-def test_cli_help():
-    result = subprocess.run(
-        [sys.executable, "-m", "jmux.cli", "--help"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "jmux" in result.stdout
-    assert "generate" in result.stdout
+from jmux.cli import main
 
 
-def test_cli_generate_help():
-    result = subprocess.run(
-        [sys.executable, "-m", "jmux.cli", "generate", "--help"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 0
-    assert "--root" in result.stdout
+def run_main(monkeypatch, *args: str) -> int:
+    # Argument handling runs in-process; only the generate tests below need a
+    # fresh interpreter, since they import the scanned files.
+    monkeypatch.setattr(sys, "argv", ["jmux", *args])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    return exc_info.value.code
+
+
+def test_cli_help(monkeypatch, capsys):
+    returncode = run_main(monkeypatch, "--help")
+    stdout = capsys.readouterr().out
+    assert returncode == 0
+    assert "jmux" in stdout
+    assert "generate" in stdout
+
+
+def test_cli_generate_help(monkeypatch, capsys):
+    returncode = run_main(monkeypatch, "generate", "--help")
+    assert returncode == 0
+    assert "--root" in capsys.readouterr().out
 
 
 def test_cli_generate_no_models():
@@ -60,11 +66,8 @@ class TestModel(StreamableBaseModel):
         assert "TestModel" in result.stdout
 
 
-def test_cli_no_command():
-    result = subprocess.run(
-        [sys.executable, "-m", "jmux.cli"],
-        capture_output=True,
-        text=True,
-    )
-    assert result.returncode == 1
-    assert "usage:" in result.stdout.lower() or "jmux" in result.stdout
+def test_cli_no_command(monkeypatch, capsys):
+    returncode = run_main(monkeypatch)
+    stdout = capsys.readouterr().out
+    assert returncode == 1
+    assert "usage:" in stdout.lower() or "jmux" in stdout
@@ -2,6 +2,7 @@ from typing import List
 
 import pytest
 
+import jmux.decoder
 from jmux.decoder import StringEscapeDecoder
 
 
@@ -260,7 +261,7 @@ def test_string_decoder__escape_at_end_of_input():
     decoder.push("b")
     decoder.push("\\")
     assert decoder.buffer == "ab"
-    assert decoder._string_escape is True
+    assert decoder.is_terminating_quote('"') is False
 
 
 def test_string_decoder__empty_string():
@@ -309,11 +310,17 @@ def test_string_decoder__mixed_content():
 def test_string_decoder__very_long_string():
     decoder = StringEscapeDecoder()
     stream = "a" * 10000
-    for ch in stream:
-        decoder.push(ch)
+    assert decoder.push_chunk(stream) == (10000, stream)
     assert decoder.buffer == "a" * 10000
 
 
+def test_string_decoder__very_long_string_with_escapes():
+    decoder = StringEscapeDecoder()
+    stream = "ab\\n\\u00e9" * 1000
+    assert decoder.push_chunk(stream + '"') == (len(stream), "ab\né" * 1000)
+    assert decoder.buffer == "ab\né" * 1000
+
+
 def test_string_decoder__all_escape_sequences_together():
     decoder = StringEscapeDecoder()
     stream = "\\\"\\\\\\b\\f\\n\\r\\t\\/"
@@ -381,7 +388,7 @@ def test_string_decoder__unicode_escape_sets_parsing_flag():
     decoder = StringEscapeDecoder()
     decoder.push("\\")
     decoder.push("u")
-    assert decoder._is_parsing_unicode is True
+    assert decoder._escape_state == jmux.decoder._ESCAPE_UNICODE
 
 
 def test_string_decoder__unicode_escape_after_regular_text():
@@ -413,8 +420,8 @@ def test_string_decoder__reset_mid_escape():
     decoder.push("0")
     decoder.reset()
     assert decoder.buffer == ""
-    assert decoder._is_parsing_unicode is False
-    assert decoder._string_escape is False
+    assert decoder._escape_state == jmux.decoder._ESCAPE_NONE
+    assert decoder.is_terminating_quote('"') is True
 
 
 def test_string_decoder__special_json_characters():
@@ -423,3 +430,157 @@ def test_string_decoder__special_json_characters():
     for ch in stream:
         decoder.push(ch)
     assert decoder.buffer == "{}[],:123"
+
+
+def test_string_decoder__push_chunk_stops_at_terminating_quote():
+    decoder = StringEscapeDecoder()
+    assert decoder.push_chunk('a\\"b\\nc"rest') == (7, 'a"b\nc')
+    assert decoder.buffer == 'a"b\nc'
+
+
+def test_string_decoder__push_chunk_from_start_index():
+    decoder = StringEscapeDecoder()
+    assert decoder.push_chunk('{"key": "value"}', 9) == (14, "value")
+    assert decoder.buffer == "value"
+
+
+def test_string_decoder__push_chunk_without_quote_consumes_chunk():
+    decoder = StringEscapeDecoder()
+    decoder.push("a")
+    assert decoder.push_chunk("bcd") == (3, "bcd")
+    assert decoder.buffer == "abcd"
+
+
+def test_string_decoder__push_chunk_completes_pending_unicode_escape():
+    decoder = StringEscapeDecoder()
+    assert decoder.push_chunk("x\\u00") == (5, "x")
+    assert decoder.push_chunk("4") == (1, "")
+    assert decoder.push_chunk('1bc"') == (3, "Abc")
+    assert decoder.buffer == "xAbc"
+
+
+def test_string_decoder__push_chunk_completes_pending_escape():
+    decoder = StringEscapeDecoder()
+    assert decoder.push_chunk("\\") == (1, "")
+    assert decoder.push_chunk('"abc') == (4, '"abc')
+    assert decoder.push_chunk("\\") == (1, "")
+    assert decoder.push_chunk('\\"') == (1, "\\")
+    assert decoder.buffer == '"abc\\'
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        "plain text",
+        'a\\nb\\"c\\\\d\\/e',
+        "\\u0041\\u00e9\\u4e2d",
+        "a\\ud83d\\ude00b",
+        "\\ud83dx\\ude00",
+        '\\\\"tail',
+        'abc"def',
+    ],
+)
+def test_string_decoder__push_chunk_matches_push_at_every_split(stream: str):
+    reference = StringEscapeDecoder()
+    end = len(stream)
+    for index, ch in enumerate(stream):
+        if reference.is_terminating_quote(ch):
+            end = index
+            break
+        reference.push(ch)
+
+    for split in range(len(stream) + 1):
+        decoder = StringEscapeDecoder()
+        index, first = decoder.push_chunk(stream[:split])
+        decoded = first
+        if index == split:
+            index, second = decoder.push_chunk(stream, split)
+            decoded += second
+        assert index == end
+        assert decoded == decoder.buffer == reference.buffer
+
+
+def test_string_decoder__buffer_reads_between_pushes():
+    decoder = StringEscapeDecoder()
+    decoder.push("a")
+    assert decoder.buffer == "a"
+    decoder.push("b")
+    decoder.push_chunk("c\\nd")
+    assert decoder.buffer == "abc\nd"
+    assert decoder.buffer == "abc\nd"
+    decoder.reset()
+    assert decoder.buffer == ""
+    decoder.push("e")
+    assert decoder.buffer == "e"
+
+
+def test_string_decoder__single_fragment_is_returned_without_joining():
+    chunk = 'prefix "a single fragment" suffix'
+    decoder = StringEscapeDecoder()
+    index, text = decoder.push_chunk(chunk, 8)
+    assert index == 25
+    assert decoder.buffer is text
+    decoder.push_chunk(" and more")
+    assert decoder.buffer == "a single fragment and more"
+
+
+def test_string_decoder__release_and_acquire_reuses_reset_decoder(monkeypatch):
+    monkeypatch.setattr(jmux.decoder, "_DECODER_POOL", [])
+    decoder = StringEscapeDecoder.acquire()
+    decoder.push_chunk("abc\\")
+    StringEscapeDecoder.release(decoder)
+
+    reused = StringEscapeDecoder.acquire()
+    assert reused is decoder
+    assert reused.buffer == ""
+    assert reused.push_chunk("n") == (1, "n")
+
+
+@pytest.mark.parametrize("ch", ["x", "é", "中"])
+def test_string_decoder__unknown_escape_keeps_character(ch: str):
+    decoder = StringEscapeDecoder()
+    decoder.push("\\")
+    assert decoder.push(ch) == ch
+    assert decoder.push_chunk(f"\\{ch}") == (2, ch)
+    assert decoder.buffer == ch + ch
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        ["\\ud83d\\ude00"],
+        ["\\ud83d", "\\ude00"],
+        ["\\ud83d\\", "ude00"],
+        ["\\ud8", "3d\\ude", "00"],
+    ],
+)
+def test_string_decoder__push_chunk_joins_surrogate_pairs(chunks: List[str]):
+    decoder = StringEscapeDecoder()
+    fragments = [decoder.push_chunk(chunk)[1] for chunk in chunks]
+    assert "".join(fragments) == "\U0001f600"
+    assert all(len(fragment) <= 1 for fragment in fragments)
+    assert decoder.buffer == "\U0001f600"
+
+
+def test_string_decoder__push_joins_surrogate_pairs():
+    decoder = StringEscapeDecoder()
+    decoded = [decoder.push(ch) for ch in "\\ud83d\\ude00!"]
+    assert [ch for ch in decoded if ch is not None] == ["\U0001f600", "!"]
+    assert decoder.buffer == "\U0001f600!"
+
+
+def test_string_decoder__lone_high_surrogate_is_kept():
+    decoder = StringEscapeDecoder()
+    assert decoder.push_chunk('\\ud83dx"') == (7, "\ud83dx")
+    decoder.reset()
+    decoder.push_chunk("\\ud83d")
+    assert decoder.buffer == "\ud83d"
+
+
+def test_string_decoder__flush_releases_held_high_surrogate():
+    decoder = StringEscapeDecoder()
+    for ch in "a\\ud83d":
+        decoder.push(ch)
+    assert decoder.flush() == "\ud83d"
+    assert decoder.flush() == ""
+    assert decoder.buffer == "a\ud83d"
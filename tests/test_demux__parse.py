@@ -1,10 +1,15 @@
 from enum import Enum
 from types import NoneType
-from typing import List, Type
+from typing import Generic, List, Tuple, Type, TypeVar
 
 import pytest
 
-from jmux.awaitable import AwaitableValue, StreamableValues
+from jmux.awaitable import (
+    AwaitableValue,
+    SinkType,
+    StreamableValues,
+    UnderlyingGenericMixin,
+)
 from jmux.demux import JMux
 from jmux.error import (
     EmptyKeyError,
@@ -15,91 +20,147 @@ from jmux.error import (
 )
 from jmux.types import Mode, State
 
+
+class SAllTypes(JMux):
+    class SNested(JMux):
+        key_str: AwaitableValue[str]
+
+    class SEnum(Enum):
+        VALUE1 = "value1"
+        VALUE2 = "value2"
+
+    key_str: AwaitableValue[str]
+    key_int: AwaitableValue[int]
+    key_float: AwaitableValue[float]
+    key_bool: AwaitableValue[bool]
+    key_none: AwaitableValue[NoneType]
+    key_stream: StreamableValues[str]
+    key_enum: AwaitableValue[SEnum]
+    key_nested: AwaitableValue[SNested]
+
+    arr_str: StreamableValues[str]
+    arr_int: StreamableValues[int]
+    arr_float: StreamableValues[float]
+    arr_bool: StreamableValues[bool]
+    arr_none: StreamableValues[NoneType]
+    arr_enum: StreamableValues[SEnum]
+    arr_nested: StreamableValues[SNested]
+
+
+# Shared prefixes of the parse streams below: every scalar key, then the nested
+# object, then every scalar array.
+_KEYS_SCALAR = (
+    '{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,'
+    '"key_none":null,"key_stream":"stream","key_enum":"value1",'
+)
+_KEYS_NESTED = _KEYS_SCALAR + '"key_nested":{"key_str":"nested"},'
+_ARRS_SCALAR = _KEYS_NESTED + (
+    '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],'
+    '"arr_bool":[true,false,true],"arr_none":[null,null],'
+    '"arr_enum":["value1","value2"],'
+)
+
+
+def _stream_id(value: object) -> str | None:
+    # Keep ids of the long streams short: their length and the tail that sets
+    # the case apart.
+    if isinstance(value, str):
+        return f"len{len(value)}-{value[-16:]}"
+    return None
+
+
+# Expected PDA stacks, shared by the cases below.
+_S_END: Tuple[Mode, ...] = ()
+_S_ROOT = (Mode.ROOT,)
+_S_OBJ = (Mode.ROOT, Mode.OBJECT)
+_S_ARR = (Mode.ROOT, Mode.ARRAY)
+_S_ARR_OBJ = (Mode.ROOT, Mode.ARRAY, Mode.OBJECT)
+
 # fmt: off
 parse_correct_stream__params = [
-    ("", [], State.START),
-    ("{", [Mode.ROOT], State.EXPECT_KEY),
-    ("{ ", [Mode.ROOT], State.EXPECT_KEY),
-    ('{"', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str"', [Mode.ROOT], State.EXPECT_COLON),
-    ('{"key_str":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": ', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": \t\n', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "', [Mode.ROOT], State.PARSING_STRING),
-    ('{"key_str": "val', [Mode.ROOT], State.PARSING_STRING),
-    ('{"key_str": "val"', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val" \t\n', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val",', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str": "val","key_int"', [Mode.ROOT], State.EXPECT_COLON),
-    ('{"key_str": "val","key_int":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int": \t\n', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":4', [Mode.ROOT], State.PARSING_INTEGER),
-    ('{"key_str": "val","key_int":42', [Mode.ROOT], State.PARSING_INTEGER),
-    ('{"key_str": "val","key_int":42,', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str": "val","key_int":42,"key_float"', [Mode.ROOT], State.EXPECT_COLON),
-    ('{"key_str": "val","key_int":42,"key_float":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14', [Mode.ROOT], State.PARSING_FLOAT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":t', [Mode.ROOT], State.PARSING_BOOLEAN),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true', [Mode.ROOT], State.PARSING_BOOLEAN),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":n', [Mode.ROOT], State.PARSING_NULL),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream', [Mode.ROOT], State.PARSING_STRING),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum', [Mode.ROOT], State.PARSING_KEY),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"val', [Mode.ROOT], State.PARSING_STRING),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1"', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{', [Mode.ROOT, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"', [Mode.ROOT, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str"', [Mode.ROOT, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"', [Mode.ROOT, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"}', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":', [Mode.ROOT], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":[', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["', [Mode.ROOT, Mode.ARRAY], State.PARSING_STRING),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1"', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1" \t\n', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1",', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1", \t\n', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2",', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3', [Mode.ROOT, Mode.ARRAY], State.PARSING_STRING),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],', [Mode.ROOT], State.EXPECT_KEY_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42', [Mode.ROOT, Mode.ARRAY], State.PARSING_INTEGER),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3', [Mode.ROOT, Mode.ARRAY], State.PARSING_FLOAT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14', [Mode.ROOT, Mode.ARRAY], State.PARSING_FLOAT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true', [Mode.ROOT, Mode.ARRAY], State.PARSING_BOOLEAN),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false', [Mode.ROOT, Mode.ARRAY], State.PARSING_BOOLEAN),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,nul', [Mode.ROOT, Mode.ARRAY], State.PARSING_NULL),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":[', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["val', [Mode.ROOT, Mode.ARRAY], State.PARSING_STRING),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1"', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{', [Mode.ROOT, Mode.ARRAY, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_s', [Mode.ROOT, Mode.ARRAY, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"}', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"},', [Mode.ROOT, Mode.ARRAY], State.EXPECT_VALUE_AFTER_COMMA),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"},{"key_str":"nes', [Mode.ROOT, Mode.ARRAY, Mode.OBJECT], State.PARSING_OBJECT),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}', [Mode.ROOT, Mode.ARRAY], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}]', [Mode.ROOT], State.EXPECT_COMMA_OR_EOC),
-    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1","key_nested":{"key_str":"nested"},"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"],"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}]}', [], State.END),
+    ("", _S_END, State.START),
+    ("{", _S_ROOT, State.EXPECT_KEY),
+    ("{ ", _S_ROOT, State.EXPECT_KEY),
+    ('{"', _S_ROOT, State.PARSING_KEY),
+    ('{"key_', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str"', _S_ROOT, State.EXPECT_COLON),
+    ('{"key_str":', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": ', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": \t\n', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "', _S_ROOT, State.PARSING_STRING),
+    ('{"key_str": "val', _S_ROOT, State.PARSING_STRING),
+    ('{"key_str": "val"', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    ('{"key_str": "val" \t\n', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    ('{"key_str": "val",', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    ('{"key_str": "val","key_int', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str": "val","key_int"', _S_ROOT, State.EXPECT_COLON),
+    ('{"key_str": "val","key_int":', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "val","key_int": \t\n', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "val","key_int":4', _S_ROOT, State.PARSING_INTEGER),
+    ('{"key_str": "val","key_int":42', _S_ROOT, State.PARSING_INTEGER),
+    ('{"key_str": "val","key_int":42,', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    ('{"key_str": "val","key_int":42,"', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str": "val","key_int":42,"key_float"', _S_ROOT, State.EXPECT_COLON),
+    ('{"key_str": "val","key_int":42,"key_float":', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "val","key_int":42,"key_float":', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "val","key_int":42,"key_float":3.14', _S_ROOT, State.PARSING_FLOAT),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":', _S_ROOT, State.EXPECT_VALUE),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":t', _S_ROOT, State.PARSING_BOOLEAN),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true', _S_ROOT, State.PARSING_BOOLEAN),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":n', _S_ROOT, State.PARSING_NULL),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream', _S_ROOT, State.PARSING_STRING),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum', _S_ROOT, State.PARSING_KEY),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"val', _S_ROOT, State.PARSING_STRING),
+    ('{"key_str": "val","key_int":42,"key_float":3.14,"key_bool":true,"key_none":null,"key_stream":"stream","key_enum":"value1"', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_SCALAR + '"key_nested":', _S_ROOT, State.EXPECT_VALUE),
+    (_KEYS_SCALAR + '"key_nested":{', _S_OBJ, State.PARSING_OBJECT),
+    (_KEYS_SCALAR + '"key_nested":{"', _S_OBJ, State.PARSING_OBJECT),
+    (_KEYS_SCALAR + '"key_nested":{"key_str"', _S_OBJ, State.PARSING_OBJECT),
+    (_KEYS_SCALAR + '"key_nested":{"key_str":"nested"', _S_OBJ, State.PARSING_OBJECT),
+    (_KEYS_SCALAR + '"key_nested":{"key_str":"nested"}', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED, _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":', _S_ROOT, State.EXPECT_VALUE),
+    (_KEYS_NESTED + '"arr_str":[', _S_ARR, State.EXPECT_VALUE),
+    (_KEYS_NESTED + '"arr_str":["', _S_ARR, State.PARSING_STRING),
+    (_KEYS_NESTED + '"arr_str":["val1"', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1" \t\n', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1",', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1", \t\n', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1","val2",', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3', _S_ARR, State.PARSING_STRING),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],', _S_ROOT, State.EXPECT_KEY_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[', _S_ARR, State.EXPECT_VALUE),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42', _S_ARR, State.PARSING_INTEGER),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3', _S_ARR, State.PARSING_FLOAT),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14', _S_ARR, State.PARSING_FLOAT),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true', _S_ARR, State.PARSING_BOOLEAN),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false', _S_ARR, State.PARSING_BOOLEAN),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,nul', _S_ARR, State.PARSING_NULL),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":[', _S_ARR, State.EXPECT_VALUE),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["val', _S_ARR, State.PARSING_STRING),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1"', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_KEYS_NESTED + '"arr_str":["val1","val2","val3"],"arr_int":[42,43],"arr_float":[3.14,31.4],"arr_bool":[true,false,true],"arr_none":[null,null],"arr_enum":["value1","value2"]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_ARRS_SCALAR + '"arr_nested":[{', _S_ARR_OBJ, State.PARSING_OBJECT),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_s', _S_ARR_OBJ, State.PARSING_OBJECT),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"}', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"},', _S_ARR, State.EXPECT_VALUE_AFTER_COMMA),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"},{"key_str":"nes', _S_ARR_OBJ, State.PARSING_OBJECT),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}', _S_ARR, State.EXPECT_COMMA_OR_EOC),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}]', _S_ROOT, State.EXPECT_COMMA_OR_EOC),
+    (_ARRS_SCALAR + '"arr_nested":[{"key_str":"nested1"},{"key_str":"nested2"}]}', _S_END, State.END),
 ]
 # fmt: on
 
@@ -107,43 +168,18 @@ parse_correct_stream__params = [
 @pytest.mark.parametrize(
     "stream,expected_stack,expected_state",
     parse_correct_stream__params,
+    ids=_stream_id,
 )
 @pytest.mark.anyio
 async def test_json_demux__parse_correct_stream__assert_state(
-    stream: str, expected_stack: List[Mode], expected_state: State
+    stream: str, expected_stack: Tuple[Mode, ...], expected_state: State
 ):
-    class SObject(JMux):
-        class SNested(JMux):
-            key_str: AwaitableValue[str]
+    s_object = SAllTypes()
 
-        class SEnum(Enum):
-            VALUE1 = "value1"
-            VALUE2 = "value2"
-
-        key_str: AwaitableValue[str]
-        key_int: AwaitableValue[int]
-        key_float: AwaitableValue[float]
-        key_bool: AwaitableValue[bool]
-        key_none: AwaitableValue[NoneType]
-        key_stream: StreamableValues[str]
-        key_enum: AwaitableValue[SEnum]
-        key_nested: AwaitableValue[SNested]
-
-        arr_str: StreamableValues[str]
-        arr_int: StreamableValues[int]
-        arr_float: StreamableValues[float]
-        arr_bool: StreamableValues[bool]
-        arr_none: StreamableValues[NoneType]
-        arr_enum: StreamableValues[SEnum]
-        arr_nested: StreamableValues[SNested]
-
-    s_object = SObject()
-
-    for ch in stream:
-        await s_object.feed_char(ch)
+    await s_object.feed_chunks(stream)
 
     assert s_object._pda.state == expected_state
-    assert s_object._pda._stack == expected_stack
+    assert tuple(s_object._pda._stack) == expected_stack
 
 
 # fmt: off
@@ -157,6 +193,7 @@ parse_incorrect_stream__params = [
     ('{"', None),
     ('{""', EmptyKeyError),
     ('{"no_actual_key"', MissingAttributeError),
+    ('{"feed_char"', MissingAttributeError),
     ('{"key_str"', None),
     ('{"key_str": ""', None),
     ('{"key_str": "" ', None),
@@ -282,45 +319,35 @@ parse_incorrect_stream__params = [
 @pytest.mark.parametrize(
     "stream,MaybeExpectedError",
     parse_incorrect_stream__params,
+    ids=_stream_id,
 )
 @pytest.mark.anyio
 async def test_json_demux__parse_stream__assert_error(
     stream: str, MaybeExpectedError: Type[Exception] | None
 ):
-    class SObject(JMux):
-        class SNested(JMux):
-            key_str: AwaitableValue[str]
+    s_object = SAllTypes()
+
+    if MaybeExpectedError:
+        with pytest.raises(MaybeExpectedError):
+            await s_object.feed_chunks(stream)
+    else:
+        await s_object.feed_chunks(stream)
 
-        class SEnum(Enum):
-            VALUE1 = "value1"
-            VALUE2 = "value2"
 
+class SOptionals(JMux):
+    class SNested(JMux):
         key_str: AwaitableValue[str]
-        key_int: AwaitableValue[int]
-        key_float: AwaitableValue[float]
-        key_bool: AwaitableValue[bool]
-        key_none: AwaitableValue[NoneType]
-        key_stream: StreamableValues[str]
-        key_enum: AwaitableValue[SEnum]
-        key_nested: AwaitableValue[SNested]
-
-        arr_str: StreamableValues[str]
-        arr_int: StreamableValues[int]
-        arr_float: StreamableValues[float]
-        arr_bool: StreamableValues[bool]
-        arr_none: StreamableValues[NoneType]
-        arr_enum: StreamableValues[SEnum]
-        arr_nested: StreamableValues[SNested]
 
-    s_object = SObject()
+    class SEnum(Enum):
+        VALUE1 = "value1"
+        VALUE2 = "value2"
 
-    if MaybeExpectedError:
-        with pytest.raises(MaybeExpectedError):
-            for ch in stream:
-                await s_object.feed_char(ch)
-    else:
-        for ch in stream:
-            await s_object.feed_char(ch)
+    key_str: AwaitableValue[str | NoneType]
+    key_int: AwaitableValue[int | NoneType]
+    key_float: AwaitableValue[float | NoneType]
+    key_bool: AwaitableValue[bool | NoneType]
+    key_enum: AwaitableValue[SEnum | NoneType]
+    key_nested: AwaitableValue[SNested | NoneType]
 
 
 # fmt: off
@@ -380,22 +407,7 @@ parse_incorrect_stream_with_optionals__params = [
 async def test_json_demux__parse_stream_with_optionals__assert_error(
     stream: str, MaybeExpectedError: Type[Exception] | None
 ):
-    class SObject(JMux):
-        class SNested(JMux):
-            key_str: AwaitableValue[str]
-
-        class SEnum(Enum):
-            VALUE1 = "value1"
-            VALUE2 = "value2"
-
-        key_str: AwaitableValue[str | NoneType]
-        key_int: AwaitableValue[int | NoneType]
-        key_float: AwaitableValue[float | NoneType]
-        key_bool: AwaitableValue[bool | NoneType]
-        key_enum: AwaitableValue[SEnum | NoneType]
-        key_nested: AwaitableValue[SNested | NoneType]
-
-    s_object = SObject()
+    s_object = SOptionals()
 
     if MaybeExpectedError:
         with pytest.raises(MaybeExpectedError):
@@ -406,6 +418,17 @@ async def test_json_demux__parse_stream_with_optionals__assert_error(
             await s_object.feed_char(ch)
 
 
+class SDoubleNested(JMux):
+    class SFirstNested(JMux):
+        class SSecondNested(JMux):
+            key_str: AwaitableValue[str]
+
+        key_second_nested: AwaitableValue[SSecondNested | NoneType]
+        key_str: AwaitableValue[str | NoneType]
+
+    key_first_nested: AwaitableValue[SFirstNested | NoneType]
+
+
 # fmt: off
 parse_correct_stream__double_nested__params = [
     ('{"key_first_nested": {"key_second_nested": {"key_str": "val"', None),
@@ -432,17 +455,7 @@ parse_correct_stream__double_nested__params = [
 async def test_json_demux__parse_stream__double_nested(
     stream: str, MaybeExpectedError: Type[Exception] | None
 ):
-    class SObject(JMux):
-        class SFirstNested(JMux):
-            class SSecondNested(JMux):
-                key_str: AwaitableValue[str]
-
-            key_second_nested: AwaitableValue[SSecondNested | NoneType]
-            key_str: AwaitableValue[str | NoneType]
-
-        key_first_nested: AwaitableValue[SFirstNested | NoneType]
-
-    s_object = SObject()
+    s_object = SDoubleNested()
 
     if MaybeExpectedError:
         with pytest.raises(MaybeExpectedError):
@@ -1427,3 +1440,156 @@ async def test_demux_parse__mixed_booleans():
 
     for ch in stream:
         await s_object.feed_char(ch)
+
+
+T = TypeVar("T")
+
+
+class RecordingSink(UnderlyingGenericMixin[T], Generic[T]):
+    def __init__(self):
+        self.items: List[T] = []
+        self.closed = False
+
+    async def put(self, item: T):
+        self.items.append(item)
+
+    async def close(self):
+        self.closed = True
+
+    async def ensure_closed(self):
+        self.closed = True
+
+    def get_current(self) -> T:
+        return self.items[-1]
+
+    def get_sink_type(self) -> SinkType:
+        return SinkType.AWAITABLE_VALUE
+
+
+@pytest.mark.anyio
+async def test_demux_parse__custom_sink_uses_protocol_methods():
+    class SObject(JMux):
+        key: RecordingSink[int]
+
+    s_object = SObject()
+    await s_object.feed_chunks('{"key": 5}')
+
+    assert s_object.key.items == [5]
+    assert s_object.key.closed
+
+
+@pytest.mark.anyio
+async def test_demux_parse__nested_type_resolved_on_sink():
+    class SNested(JMux):
+        key: AwaitableValue[str]
+
+    class SObject(JMux):
+        nested: AwaitableValue[SNested | None]
+        arr: StreamableValues[SNested]
+        key_str: AwaitableValue[str]
+
+    s_object = SObject()
+    assert s_object.nested._underlying_type is SNested
+    assert s_object.arr._underlying_type is SNested
+    assert s_object.key_str._underlying_type is None
+
+    await s_object.feed_chunks(
+        '{"nested": {"key": "a"}, "arr": [{"key": "b"}, {"key": "c"}], "key_str": "x"}'
+    )
+
+    nested = await s_object.nested
+    assert isinstance(nested, SNested)
+    assert await nested.key == "a"
+    keys = [await item.key async for item in s_object.arr]
+    assert keys == ["b", "c"]
+
+
+@pytest.mark.anyio
+async def test_demux_parse__string_with_surrogate_pair():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+        key_stream: StreamableValues[str]
+
+    s_object = SObject()
+    await s_object.feed_chunks('{"key_str": "\\ud83d\\ude00", "key_stream": "a\\ud83d')
+    await s_object.feed_chunks('\\ude00b"}')
+
+    assert await s_object.key_str == "\U0001f600"
+    fragments = [fragment async for fragment in s_object.key_stream]
+    assert fragments == ["a", "\U0001f600b"]
+
+
+@pytest.mark.anyio
+async def test_demux_parse__subclass_fields_resolved_per_class():
+    class SBase(JMux):
+        key_str: AwaitableValue[str]
+
+    class SChild(SBase):
+        key_int: AwaitableValue[int]
+
+    s_base = SBase()
+    s_child = SChild()
+    await s_base.feed_chunks('{"key_str": "base"}')
+    await s_child.feed_chunks('{"key_str": "child", "key_int": 42}')
+
+    assert await s_base.key_str == "base"
+    assert not hasattr(s_base, "key_int")
+    assert await s_child.key_str == "child"
+    assert await s_child.key_int == 42
+
+
+def test_demux_parse__field_schema_cached_on_class():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+
+    first = SObject()
+    second = SObject()
+
+    assert "_jmux_fields" in SObject.__dict__
+    assert first.key_str is not second.key_str
+    assert list(first._fields) == list(second._fields) == ["key_str"]
+
+
+@pytest.mark.anyio
+async def test_demux_parse__error_message_names_stack_modes():
+    s_object = SAllTypes()
+
+    with pytest.raises(UnexpectedCharacterError) as exc_info:
+        await s_object.feed_chunks('{"arr_int": [x')
+
+    assert "in state 'expect_value' with stack ['$', 'array']" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "stream,message",
+    [
+        ('{"key_bool": trux', "Trying to parse 'boolean'"),
+        ('{"key_bool": trut', "buffer for 'boolean': 'trut'"),
+        ('{"key_bool": falsef', "buffer for 'boolean': 'falsef'"),
+        ('{"key_none": nulx', "Trying to parse 'null'"),
+        ('{"key_none": nulll', "buffer for 'null': 'nulll'"),
+    ],
+)
+@pytest.mark.anyio
+async def test_demux_parse__keyword_mismatch_messages(stream: str, message: str):
+    s_object = SAllTypes()
+
+    with pytest.raises(UnexpectedCharacterError, match=message):
+        await s_object.feed_chunks(stream)
+
+
+@pytest.mark.parametrize(
+    "stream",
+    [
+        '{"key_int": 42x',
+        '{"key_int": 4.2',
+        '{"key_float": 3.1x',
+        '{"arr_int": [1, 23a',
+    ],
+)
+@pytest.mark.anyio
+async def test_demux_parse__number_run_terminator_is_checked(stream: str):
+    s_object = SAllTypes()
+
+    with pytest.raises(UnexpectedCharacterError):
+        await s_object.feed_chunks(stream)
@@ -3,7 +3,7 @@ import os
 import sys
 from enum import Enum
 from types import NoneType
-from typing import List, Optional, Type
+from typing import AsyncIterator, List, Optional, Type
 
 import anyio
 import pytest
@@ -13,6 +13,7 @@ if sys.version_info >= (3, 11):
 else:
     from exceptiongroup import BaseExceptionGroup
 
+import jmux.decoder
 from jmux.awaitable import AwaitableValue, StreamableValues
 from jmux.demux import JMux
 from jmux.error import (
@@ -20,19 +21,16 @@ from jmux.error import (
 )
 
 
-class AsyncStreamGenerator:
-    stream: str
+async def char_stream(stream: str) -> AsyncIterator[str]:
+    for char in stream:
+        yield char
+        await anyio.sleep(0)
 
-    def __init__(self, stream):
-        self.stream = stream
 
-    async def __anext__(self):
-        raise Exception("This method is not implemented")
-
-    async def __aiter__(self):
-        for char in self.stream:
-            yield char
-            await anyio.sleep(0)
+async def chunk_stream(stream: str, size: int) -> AsyncIterator[str]:
+    for start in range(0, len(stream), size):
+        yield stream[start : start + size]
+        await anyio.sleep(0)
 
 
 LOG_EMITS = os.environ.get("LOG_EMITS", "0") == "1"
@@ -43,217 +41,220 @@ def log_emit(message: str):
         print(message)
 
 
+class SCityName(JMux):
+    city_name: StreamableValues[str]
+    country: StreamableValues[str]
+
+
+simple_json__params = [
+    (
+        '{"city_name":"Paris","country":"France"}',
+        [
+            "[producer] sending: {",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: i",
+            "[producer] sending: t",
+            "[producer] sending: y",
+            "[producer] sending: _",
+            "[producer] sending: n",
+            "[producer] sending: a",
+            "[producer] sending: m",
+            "[producer] sending: e",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            '[producer] sending: "',
+            "[producer] sending: P",
+            "[city] received: P",
+            "[producer] sending: a",
+            "[city] received: a",
+            "[producer] sending: r",
+            "[city] received: r",
+            "[producer] sending: i",
+            "[city] received: i",
+            "[producer] sending: s",
+            "[city] received: s",
+            '[producer] sending: "',
+            "[producer] sending: ,",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: o",
+            "[producer] sending: u",
+            "[producer] sending: n",
+            "[producer] sending: t",
+            "[producer] sending: r",
+            "[producer] sending: y",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            '[producer] sending: "',
+            "[producer] sending: F",
+            "[country] received: F",
+            "[producer] sending: r",
+            "[country] received: r",
+            "[producer] sending: a",
+            "[country] received: a",
+            "[producer] sending: n",
+            "[country] received: n",
+            "[producer] sending: c",
+            "[country] received: c",
+            "[producer] sending: e",
+            "[country] received: e",
+            '[producer] sending: "',
+            "[producer] sending: }",
+        ],
+    ),
+    (
+        '{"city_name": "Paris", "country": "France"}',
+        [
+            "[producer] sending: {",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: i",
+            "[producer] sending: t",
+            "[producer] sending: y",
+            "[producer] sending: _",
+            "[producer] sending: n",
+            "[producer] sending: a",
+            "[producer] sending: m",
+            "[producer] sending: e",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            "[producer] sending:  ",
+            '[producer] sending: "',
+            "[producer] sending: P",
+            "[city] received: P",
+            "[producer] sending: a",
+            "[city] received: a",
+            "[producer] sending: r",
+            "[city] received: r",
+            "[producer] sending: i",
+            "[city] received: i",
+            "[producer] sending: s",
+            "[city] received: s",
+            '[producer] sending: "',
+            "[producer] sending: ,",
+            "[producer] sending:  ",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: o",
+            "[producer] sending: u",
+            "[producer] sending: n",
+            "[producer] sending: t",
+            "[producer] sending: r",
+            "[producer] sending: y",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            "[producer] sending:  ",
+            '[producer] sending: "',
+            "[producer] sending: F",
+            "[country] received: F",
+            "[producer] sending: r",
+            "[country] received: r",
+            "[producer] sending: a",
+            "[country] received: a",
+            "[producer] sending: n",
+            "[country] received: n",
+            "[producer] sending: c",
+            "[country] received: c",
+            "[producer] sending: e",
+            "[country] received: e",
+            '[producer] sending: "',
+            "[producer] sending: }",
+        ],
+    ),
+    (
+        '{\n\t"city_name": "Paris",\n\t"country": "France"\n}',
+        [
+            "[producer] sending: {",
+            "[producer] sending: \n",
+            "[producer] sending: \t",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: i",
+            "[producer] sending: t",
+            "[producer] sending: y",
+            "[producer] sending: _",
+            "[producer] sending: n",
+            "[producer] sending: a",
+            "[producer] sending: m",
+            "[producer] sending: e",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            "[producer] sending:  ",
+            '[producer] sending: "',
+            "[producer] sending: P",
+            "[city] received: P",
+            "[producer] sending: a",
+            "[city] received: a",
+            "[producer] sending: r",
+            "[city] received: r",
+            "[producer] sending: i",
+            "[city] received: i",
+            "[producer] sending: s",
+            "[city] received: s",
+            '[producer] sending: "',
+            "[producer] sending: ,",
+            "[producer] sending: \n",
+            "[producer] sending: \t",
+            '[producer] sending: "',
+            "[producer] sending: c",
+            "[producer] sending: o",
+            "[producer] sending: u",
+            "[producer] sending: n",
+            "[producer] sending: t",
+            "[producer] sending: r",
+            "[producer] sending: y",
+            '[producer] sending: "',
+            "[producer] sending: :",
+            "[producer] sending:  ",
+            '[producer] sending: "',
+            "[producer] sending: F",
+            "[country] received: F",
+            "[producer] sending: r",
+            "[country] received: r",
+            "[producer] sending: a",
+            "[country] received: a",
+            "[producer] sending: n",
+            "[country] received: n",
+            "[producer] sending: c",
+            "[country] received: c",
+            "[producer] sending: e",
+            "[country] received: e",
+            '[producer] sending: "',
+            "[producer] sending: \n",
+            "[producer] sending: }",
+        ],
+    ),
+]
+
+
 @pytest.mark.parametrize(
     "stream,expected_operations",
-    [
-        (
-            '{"city_name":"Paris","country":"France"}',
-            [
-                "[producer] sending: {",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: i",
-                "[producer] sending: t",
-                "[producer] sending: y",
-                "[producer] sending: _",
-                "[producer] sending: n",
-                "[producer] sending: a",
-                "[producer] sending: m",
-                "[producer] sending: e",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                '[producer] sending: "',
-                "[producer] sending: P",
-                "[city] received: P",
-                "[producer] sending: a",
-                "[city] received: a",
-                "[producer] sending: r",
-                "[city] received: r",
-                "[producer] sending: i",
-                "[city] received: i",
-                "[producer] sending: s",
-                "[city] received: s",
-                '[producer] sending: "',
-                "[producer] sending: ,",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: o",
-                "[producer] sending: u",
-                "[producer] sending: n",
-                "[producer] sending: t",
-                "[producer] sending: r",
-                "[producer] sending: y",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                '[producer] sending: "',
-                "[producer] sending: F",
-                "[country] received: F",
-                "[producer] sending: r",
-                "[country] received: r",
-                "[producer] sending: a",
-                "[country] received: a",
-                "[producer] sending: n",
-                "[country] received: n",
-                "[producer] sending: c",
-                "[country] received: c",
-                "[producer] sending: e",
-                "[country] received: e",
-                '[producer] sending: "',
-                "[producer] sending: }",
-            ],
-        ),
-        (
-            '{"city_name": "Paris", "country": "France"}',
-            [
-                "[producer] sending: {",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: i",
-                "[producer] sending: t",
-                "[producer] sending: y",
-                "[producer] sending: _",
-                "[producer] sending: n",
-                "[producer] sending: a",
-                "[producer] sending: m",
-                "[producer] sending: e",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                "[producer] sending:  ",
-                '[producer] sending: "',
-                "[producer] sending: P",
-                "[city] received: P",
-                "[producer] sending: a",
-                "[city] received: a",
-                "[producer] sending: r",
-                "[city] received: r",
-                "[producer] sending: i",
-                "[city] received: i",
-                "[producer] sending: s",
-                "[city] received: s",
-                '[producer] sending: "',
-                "[producer] sending: ,",
-                "[producer] sending:  ",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: o",
-                "[producer] sending: u",
-                "[producer] sending: n",
-                "[producer] sending: t",
-                "[producer] sending: r",
-                "[producer] sending: y",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                "[producer] sending:  ",
-                '[producer] sending: "',
-                "[producer] sending: F",
-                "[country] received: F",
-                "[producer] sending: r",
-                "[country] received: r",
-                "[producer] sending: a",
-                "[country] received: a",
-                "[producer] sending: n",
-                "[country] received: n",
-                "[producer] sending: c",
-                "[country] received: c",
-                "[producer] sending: e",
-                "[country] received: e",
-                '[producer] sending: "',
-                "[producer] sending: }",
-            ],
-        ),
-        (
-            '{\n\t"city_name": "Paris",\n\t"country": "France"\n}',
-            [
-                "[producer] sending: {",
-                "[producer] sending: \n",
-                "[producer] sending: \t",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: i",
-                "[producer] sending: t",
-                "[producer] sending: y",
-                "[producer] sending: _",
-                "[producer] sending: n",
-                "[producer] sending: a",
-                "[producer] sending: m",
-                "[producer] sending: e",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                "[producer] sending:  ",
-                '[producer] sending: "',
-                "[producer] sending: P",
-                "[city] received: P",
-                "[producer] sending: a",
-                "[city] received: a",
-                "[producer] sending: r",
-                "[city] received: r",
-                "[producer] sending: i",
-                "[city] received: i",
-                "[producer] sending: s",
-                "[city] received: s",
-                '[producer] sending: "',
-                "[producer] sending: ,",
-                "[producer] sending: \n",
-                "[producer] sending: \t",
-                '[producer] sending: "',
-                "[producer] sending: c",
-                "[producer] sending: o",
-                "[producer] sending: u",
-                "[producer] sending: n",
-                "[producer] sending: t",
-                "[producer] sending: r",
-                "[producer] sending: y",
-                '[producer] sending: "',
-                "[producer] sending: :",
-                "[producer] sending:  ",
-                '[producer] sending: "',
-                "[producer] sending: F",
-                "[country] received: F",
-                "[producer] sending: r",
-                "[country] received: r",
-                "[producer] sending: a",
-                "[country] received: a",
-                "[producer] sending: n",
-                "[country] received: n",
-                "[producer] sending: c",
-                "[country] received: c",
-                "[producer] sending: e",
-                "[country] received: e",
-                '[producer] sending: "',
-                "[producer] sending: \n",
-                "[producer] sending: }",
-            ],
-        ),
-    ],
+    simple_json__params,
+    ids=["compact", "spaced", "pretty"],
 )
 @pytest.mark.anyio
 async def test_json_demux__simple_json(stream: str, expected_operations: List[str]):
-    class SCityName(JMux):
-        city_name: StreamableValues[str]
-        country: StreamableValues[str]
-
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_city = SCityName()
 
-    city_name = ""
-    country = ""
+    city_chars: List[str] = []
+    country_chars: List[str] = []
     operation_list = []
 
     async def consume_city():
-        nonlocal city_name
         async for ch in s_city.city_name:
             op = f"[city] received: {ch}"
             log_emit(op)
             operation_list.append(op)
-            city_name += ch
+            city_chars.append(ch)
 
     async def consume_country():
-        nonlocal country
         async for ch in s_city.country:
             op = f"[country] received: {ch}"
             log_emit(op)
             operation_list.append(op)
-            country += ch
+            country_chars.append(ch)
 
     async def produce():
         async for ch in llm_stream:
@@ -272,12 +273,54 @@ async def test_json_demux__simple_json(stream: str, expected_operations: List[st
 
     parsed_json = json.loads(stream)
 
-    assert parsed_json["city_name"] == city_name
-    assert parsed_json["country"] == country
+    assert parsed_json["city_name"] == "".join(city_chars)
+    assert parsed_json["country"] == "".join(country_chars)
 
     assert operation_list == expected_operations
 
 
+@pytest.mark.parametrize("size", [1, 3, 64])
+@pytest.mark.parametrize(
+    "stream",
+    [stream for stream, _ in simple_json__params],
+    ids=["compact", "spaced", "pretty"],
+)
+@pytest.mark.anyio
+async def test_json_demux__simple_json__chunked(stream: str, size: int):
+    llm_stream = chunk_stream(stream, size)
+    s_city = SCityName()
+
+    city_fragments: List[str] = []
+    country_fragments: List[str] = []
+
+    async def consume_city():
+        async for fragment in s_city.city_name:
+            city_fragments.append(fragment)
+
+    async def consume_country():
+        async for fragment in s_city.country:
+            country_fragments.append(fragment)
+
+    async def produce():
+        async for chunk in llm_stream:
+            await s_city.feed_chunks(chunk)
+
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(produce)
+        tg.start_soon(consume_city)
+        tg.start_soon(consume_country)
+
+    parsed_json = json.loads(stream)
+
+    assert parsed_json["city_name"] == "".join(city_fragments)
+    assert parsed_json["country"] == "".join(country_fragments)
+    assert all(len(fragment) <= size for fragment in city_fragments)
+
+
+class SEmojis(JMux):
+    emojis: StreamableValues[str]
+
+
 @pytest.mark.parametrize(
     "stream,expected_operations",
     [
@@ -343,21 +386,17 @@ async def test_json_demux__simple_json(stream: str, expected_operations: List[st
 )
 @pytest.mark.anyio
 async def test_json_demux__utf8(stream: str, expected_operations: List[str]):
-    class SEmojis(JMux):
-        emojis: StreamableValues[str]
-
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_emoji = SEmojis()
 
-    emojis = ""
+    emoji_chars: List[str] = []
     operation_list = []
 
     async def consume_emojis():
-        nonlocal emojis
         async for ch in s_emoji.emojis:
             op = f"[emojis] received: {ch}"
             operation_list.append(op)
-            emojis += ch
+            emoji_chars.append(ch)
 
     async def produce():
         async for ch in llm_stream:
@@ -374,10 +413,23 @@ async def test_json_demux__utf8(stream: str, expected_operations: List[str]):
 
     parsed_json = json.loads(stream)
 
-    assert emojis == parsed_json["emojis"]
+    assert "".join(emoji_chars) == parsed_json["emojis"]
     assert operation_list == expected_operations
 
 
+class SPrimitives(JMux):
+    class SEnum(Enum):
+        VALUE1 = "value1"
+        VALUE2 = "value2"
+
+    my_str: AwaitableValue[str]
+    my_int: AwaitableValue[int]
+    my_float: AwaitableValue[float]
+    my_bool: AwaitableValue[bool]
+    my_enum: AwaitableValue[SEnum]
+    my_none: AwaitableValue[NoneType]
+
+
 @pytest.mark.parametrize(
     "stream,expected_operations",
     [
@@ -489,19 +541,7 @@ async def test_json_demux__utf8(stream: str, expected_operations: List[str]):
 )
 @pytest.mark.anyio
 async def test_json_demux__primitives(stream: str, expected_operations: List[str]):
-    class SPrimitives(JMux):
-        class SEnum(Enum):
-            VALUE1 = "value1"
-            VALUE2 = "value2"
-
-        my_str: AwaitableValue[str]
-        my_int: AwaitableValue[int]
-        my_float: AwaitableValue[float]
-        my_bool: AwaitableValue[bool]
-        my_enum: AwaitableValue[SEnum]
-        my_none: AwaitableValue[NoneType]
-
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_primitives = SPrimitives()
 
     my_str: Optional[str] = None
@@ -653,7 +693,7 @@ async def test_json_demux__primitives__partial_streams(
         arr_none: StreamableValues[NoneType]
         arr_nested: StreamableValues[SNested]
 
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_primitives = SObject()
 
     my_str: Optional[str] = None
@@ -792,7 +832,7 @@ async def test_json_demux__nested(stream: str, expected_operations: List[str]):
 
         nested: AwaitableValue[SNested]
 
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_parent = SParent()
 
     nested: Optional[SParent.SNested] = None
@@ -899,7 +939,7 @@ async def test_json_demux__object_with_array_of_objects(
 
         arr: StreamableValues[SArrayElement]
 
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_parent = SParent()
 
     arr: List[SParent.SArrayElement] = []
@@ -1055,7 +1095,7 @@ async def test_json_demux__object_with_array_of_primitives(
         arr_bool: StreamableValues[bool]
         arr_str: StreamableValues[str]
 
-    llm_stream = AsyncStreamGenerator(stream)
+    llm_stream = char_stream(stream)
     s_parent = SParent()
 
     arr_int: List[int] = []
@@ -1445,3 +1485,196 @@ async def test_string_with_quotes():
         await s_object.feed_char(ch)
 
     assert await s_object.key == 'say "hello"'
+
+
+@pytest.mark.anyio
+async def test_feed_chunks_streams_string_runs_as_fragments():
+    class SObject(JMux):
+        key: StreamableValues[str]
+
+    s_object = SObject()
+    await s_object.feed_chunks('{"key": "hel')
+    await s_object.feed_chunks("lo\\nwor")
+    await s_object.feed_chunks('ld"}')
+
+    fragments = []
+    async for fragment in s_object.key:
+        fragments.append(fragment)
+
+    assert fragments == ["hel", "lo\nwor", "ld"]
+
+
+@pytest.mark.anyio
+async def test_feed_chunks_string_runs_in_array():
+    class SObject(JMux):
+        arr: StreamableValues[str]
+
+    s_object = SObject()
+    await s_object.feed_chunks('{"arr": ["first", "sec')
+    await s_object.feed_chunks('ond\\"", "third"]}')
+
+    items = []
+    async for item in s_object.arr:
+        items.append(item)
+
+    assert items == ["first", 'second"', "third"]
+
+
+@pytest.mark.anyio
+async def test_feed_chunks_keys_split_across_chunks():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+        key_int: AwaitableValue[int]
+
+    s_object = SObject()
+    await s_object.feed_chunks('{"ke')
+    await s_object.feed_chunks('y_str": "a", "key\\u005f')
+    await s_object.feed_chunks('int": 1}')
+
+    assert await s_object.key_str == "a"
+    assert await s_object.key_int == 1
+
+
+@pytest.mark.anyio
+async def test_feed_bytes_splits_multibyte_characters():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+        key_stream: StreamableValues[str]
+
+    data = '{"key_str": "café", "key_stream": "\U0001f600 ok"}'.encode()
+    s_object = SObject()
+    for index in range(len(data)):
+        await s_object.feed_bytes(data[index : index + 1])
+
+    fragments = []
+    async for fragment in s_object.key_stream:
+        fragments.append(fragment)
+
+    assert await s_object.key_str == "café"
+    assert "".join(fragments) == "\U0001f600 ok"
+
+
+@pytest.mark.anyio
+async def test_feed_bytes_rejects_invalid_utf8():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+
+    s_object = SObject()
+    with pytest.raises(UnicodeDecodeError):
+        await s_object.feed_bytes(b'{"key_str": "\xff"}')
+
+
+@pytest.mark.anyio
+async def test_feed_bytes_accepts_memoryview():
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+        key_int: AwaitableValue[int]
+
+    buffer = bytearray('{"key_str": "naïve", "key_int": 7}'.encode())
+    view = memoryview(buffer)
+    s_object = SObject()
+    await s_object.feed_bytes(view[:16])
+    await s_object.feed_bytes(view[16:])
+
+    assert await s_object.key_str == "naïve"
+    assert await s_object.key_int == 7
+
+
+@pytest.mark.anyio
+async def test_feed_chunks_numbers_at_every_split():
+    class SObject(JMux):
+        key_int: AwaitableValue[int]
+        key_float: AwaitableValue[float]
+        arr_int: StreamableValues[int]
+
+    stream = '{"key_int": -1234, "key_float": 3.5e+2, "arr_int": [10, 200,3000]}'
+    for split in range(len(stream) + 1):
+        s_object = SObject()
+        await s_object.feed_chunks(stream[:split])
+        await s_object.feed_chunks(stream[split:])
+
+        items = []
+        async for item in s_object.arr_int:
+            items.append(item)
+
+        assert await s_object.key_int == -1234
+        assert await s_object.key_float == 350.0
+        assert items == [10, 200, 3000]
+
+
+@pytest.mark.anyio
+async def test_feed_chunks_whitespace_runs_at_every_split():
+    class SNested(JMux):
+        key_str: AwaitableValue[str]
+
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+        key_int: AwaitableValue[int]
+        key_nested: AwaitableValue[SNested]
+        arr_int: StreamableValues[int]
+
+    stream = (
+        ' \n{ \t"key_str" \r\n:  " a  b "  ,\n  "key_int"\t:\t7 \n,'
+        ' "key_nested" : {  "key_str" :  "  c  " } ,'
+        ' "arr_int" : [ 1 ,  2\n ]\n}\n \t'
+    )
+    for split in range(len(stream) + 1):
+        s_object = SObject()
+        await s_object.feed_chunks(stream[:split])
+        await s_object.feed_chunks(stream[split:])
+
+        items = []
+        async for item in s_object.arr_int:
+            items.append(item)
+        nested = await s_object.key_nested
+
+        assert await s_object.key_str == " a  b "
+        assert await s_object.key_int == 7
+        assert await nested.key_str == "  c  "
+        assert items == [1, 2]
+
+
+@pytest.mark.anyio
+async def test_lone_trailing_high_surrogate_streamed_by_feed_char_and_feed_chunks():
+    class SObject(JMux):
+        s: StreamableValues[str]
+
+    stream = '{"s":"a\\ud83d"}'
+
+    by_char = SObject()
+    for ch in stream:
+        await by_char.feed_char(ch)
+    by_chunks = SObject()
+    await by_chunks.feed_chunks(stream)
+
+    char_fragments = [fragment async for fragment in by_char.s]
+    chunk_fragments = [fragment async for fragment in by_chunks.s]
+
+    assert char_fragments == ["a", "\ud83d"]
+    assert chunk_fragments == ["a\ud83d"]
+    assert "".join(char_fragments) == "".join(chunk_fragments)
+    assert by_char.s.get_current() == "\ud83d"
+
+
+@pytest.mark.anyio
+async def test_finalized_object_drops_pooled_decoder(monkeypatch):
+    monkeypatch.setattr(jmux.decoder, "_DECODER_POOL", [])
+
+    class SObject(JMux):
+        key_str: AwaitableValue[str]
+
+    s_object = SObject()
+    decoder = s_object._decoder
+    await s_object.feed_chunks('{"key_str": "val"}')
+
+    assert jmux.decoder._DECODER_POOL == [decoder]
+    assert s_object._decoder is not decoder
+    assert s_object._decoder.buffer == ""
+    with pytest.raises(ValueError):
+        s_object._decoder.push("x")
+
+    other = SObject()
+    assert other._decoder is decoder
+    await other.feed_chunks('{"key_str": "ot')
+    assert s_object._decoder.buffer == ""
+    assert decoder.buffer == "ot"
@@ -1,3 +1,4 @@
+import sys
 from enum import Enum
 from textwrap import dedent
 from typing import Annotated, Optional, Union
@@ -5,7 +6,12 @@ from typing import Annotated, Optional, Union
 import pytest
 
 from jmux.base import StreamableBaseModel, Streamed
-from jmux.generator import extract_models_from_source, generate_jmux_code, get_jmux_type
+from jmux.generator import (
+    _source_imports_streamable_base_model,
+    extract_models_from_source,
+    generate_jmux_code,
+    get_jmux_type,
+)
 
 
 def dedent_strip(text: str) -> str:
@@ -63,6 +69,9 @@ class ListNestedModel(StreamableBaseModel):
         (Annotated[str, Streamed], "StreamableValues[str]"),
         (list[str], "StreamableValues[str]"),
         (list[int], "StreamableValues[int]"),
+        (list[bool], "StreamableValues[bool]"),
+        (None, "AwaitableValue[None]"),
+        (type(None), "AwaitableValue[None]"),
         (Status, "AwaitableValue[Status]"),
         (str | None, "AwaitableValue[str | None]"),
         (Union[str, None], "AwaitableValue[str | None]"),
@@ -85,6 +94,21 @@ def test_extract_no_import():
     assert extract_models_from_source(source) == []
 
 
+@pytest.mark.parametrize(
+    "source,expected",
+    [
+        ("import json\n", False),
+        ("from other import StreamableBaseModel\n", False),
+        ("from jmux import StreamableBaseModel\n", True),
+        ("from jmux.base import StreamableBaseModel\n", True),
+        ("import jmux\n", True),
+        ("from jmux import JMux\n", False),
+    ],
+)
+def test_source_imports_streamable_base_model(source, expected):
+    assert _source_imports_streamable_base_model(source) is expected
+
+
 def test_extract_syntax_error():
     assert extract_models_from_source("class Foo( invalid syntax") == []
 
@@ -336,3 +360,77 @@ def test_generate_jmux_code_enum_imports():
         from jmux.demux import JMux
         """
     )
+
+
+def test_generate_jmux_code_resolves_annotations_once_per_model(monkeypatch):
+    import jmux.generator as generator
+
+    calls = []
+    original = generator.get_type_hints
+
+    def counting_get_type_hints(model, *args, **kwargs):
+        calls.append(model)
+        return original(model, *args, **kwargs)
+
+    monkeypatch.setattr(generator, "get_type_hints", counting_get_type_hints)
+    generate_jmux_code([NestedOuterModel, NestedInnerModel])
+
+    assert sorted(c.__name__ for c in calls) == [
+        "NestedInnerModel",
+        "NestedOuterModel",
+    ]
+    assert generator._get_resolved_annotations.cache_info().currsize == 0
+
+
+def test_generate_jmux_code_clears_annotation_cache_on_enum_error(monkeypatch):
+    import jmux.generator as generator
+
+    def failing_collect_enums(annotation, enums):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(generator, "_collect_enums_from_type", failing_collect_enums)
+    with pytest.raises(RuntimeError):
+        generate_jmux_code([NestedOuterModel])
+
+    assert generator._get_resolved_annotations.cache_info().currsize == 0
+
+
+def test_find_streamable_models_parallel_scan(monkeypatch, tmp_path):
+    import jmux.generator as generator
+
+    monkeypatch.setattr(generator, "_PARALLEL_SCAN_MIN_FILES", 0)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "plain_module.py").write_text("x = 1\n")
+    (tmp_path / "scanned_models.py").write_text(
+        dedent_strip(
+            """
+            from jmux import StreamableBaseModel
+
+            class ScannedModel(StreamableBaseModel):
+                name: str
+            """
+        )
+    )
+
+    models = generator.find_streamable_models(tmp_path)
+
+    assert [m.__name__ for m in models] == ["ScannedModel"]
+
+
+def test_generate_jmux_code_deep_nesting_chain():
+    depth = sys.getrecursionlimit() * 2
+    chain: list[type[StreamableBaseModel]] = []
+    inner: type[StreamableBaseModel] | None = None
+    for i in range(depth):
+        annotations = {"value": str} if inner is None else {"child": inner}
+        inner = type(
+            f"Chain{i}Model",
+            (StreamableBaseModel,),
+            {"__annotations__": annotations, "__module__": __name__},
+        )
+        chain.append(inner)
+
+    code = generate_jmux_code(chain[::-1])
+
+    positions = [code.index(f"class Chain{i}ModelJMux(JMux):") for i in range(depth)]
+    assert positions == sorted(positions)
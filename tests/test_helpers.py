@@ -224,3 +224,29 @@ def test_extract_types_from_generic_alias__raises_on_multi_type_union_in_generic
 def test_extract_types_from_generic_alias__raises_on_union_without_none_in_generic():
     with pytest.raises(TypeError):
         extract_types_from_generic_alias(AwaitableValue[int | float])
+
+
+def test_extract_types_from_generic_alias__cached_results_are_not_shared():
+    first_main, first_sub = extract_types_from_generic_alias(
+        StreamableValues[int | None]
+    )
+    first_main.add(str)
+    first_sub.clear()
+
+    second_main, second_sub = extract_types_from_generic_alias(
+        StreamableValues[int | None]
+    )
+    assert second_main == {StreamableValues}
+    assert second_sub == {int, NoneType}
+
+
+def test_deconstruct_flat_type__cached_results_are_not_shared():
+    deconstruct_flat_type(int | None).pop()
+    assert deconstruct_flat_type(int | None) == {int, NoneType}
+
+
+def test_type_hint_caches_are_bounded():
+    from jmux import helpers
+
+    assert helpers._extract_types_from_generic_alias.cache_info().maxsize == 1024
+    assert helpers._deconstruct_flat_type.cache_info().maxsize == 1024
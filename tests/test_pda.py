@@ -82,6 +82,14 @@ def test_pda_push_multiple():
     assert pda.top == Mode.ARRAY
 
 
+def test_pda_push_is_bound_per_instance():
+    first = PushDownAutomata[Mode, State](State.START)
+    second = PushDownAutomata[Mode, State](State.START)
+    first.push(Mode.ROOT)
+    assert first.stack == [Mode.ROOT]
+    assert second.stack == []
+
+
 def test_pda_pop_single():
     pda = PushDownAutomata[Mode, State](State.START)
     pda.push(Mode.ROOT)